@@ -1,6 +1,12 @@
 from fastapi import APIRouter
+from api.v1.admin import router as admin_router
+from api.v1.alerts import router as alerts_router
 from api.v1.currency import router as currency_router
+from api.v1.ledger import router as ledger_router
 
 v1_router = APIRouter(prefix="/v1", tags=["v1"])
 
 v1_router.include_router(router=currency_router)
+v1_router.include_router(router=ledger_router)
+v1_router.include_router(router=alerts_router)
+v1_router.include_router(router=admin_router)
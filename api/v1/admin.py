@@ -0,0 +1,186 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from core.config import settings
+from core.dependencies import AdmissionDep, DiagnosticsServiceDep, verify_admin_token
+from schemas.admin import AdminResponse, AdmissionStatsSchema, SlowRequestSchema
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_token)])
+
+
+@router.get(
+    path="/admission/",
+    response_model=AdmissionStatsSchema,
+    summary="Статистика контроля допуска",
+    description="Возвращает число запросов в обработке, глубину очереди и число отброшенных запросов.",
+    responses={
+        403: {"description": "Admin API is disabled / Invalid admin token"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def get_admission_stats(
+    admission: AdmissionDep,
+):
+    """
+    Получает статистику контроля допуска по классам запросов (чтение/запись).
+
+    Args:
+        admission (AdmissionDep): Зависимость контроллера допуска.
+
+    Returns:
+        AdmissionStatsSchema: Число запросов в обработке, в очереди, допущенных и отброшенных.
+
+    Raises:
+        HTTPException: Если административный API отключён или токен неверен (status_code=403).
+    """
+    return admission.stats()
+
+
+@router.post(
+    path="/profile/start/",
+    response_model=AdminResponse,
+    summary="Запуск профилирования",
+    description="Запускает сеанс cProfile для потока цикла событий.",
+    responses={
+        403: {"description": "Admin API is disabled / Invalid admin token"},
+        409: {"description": "Profiling is already running"},
+    },
+)
+async def start_profiling(
+    diagnostics_service: DiagnosticsServiceDep,
+):
+    """
+    Запускает сеанс профилирования cProfile во время работы приложения.
+
+    Args:
+        diagnostics_service (DiagnosticsServiceDep): Зависимость сервиса диагностики.
+
+    Returns:
+        AdminResponse: Объект с сообщением о запуске профилирования.
+
+    Raises:
+        HTTPException: Если токен неверен (status_code=403) или сеанс уже запущен (status_code=409).
+    """
+    diagnostics_service.start_profiling()
+    return AdminResponse(detail="Profiling started")
+
+
+@router.post(
+    path="/profile/stop/",
+    response_class=PlainTextResponse,
+    summary="Остановка профилирования",
+    description="Останавливает сеанс cProfile, сохраняет его в файл и возвращает текстовый отчёт.",
+    responses={
+        403: {"description": "Admin API is disabled / Invalid admin token"},
+        409: {"description": "Profiling is not running"},
+    },
+)
+async def stop_profiling(
+    diagnostics_service: DiagnosticsServiceDep,
+    limit: int = Query(settings.profiler_config.report_limit, gt=0),
+):
+    """
+    Останавливает сеанс профилирования и возвращает отчёт.
+
+    Полный результат сохраняется в файл, указанный в конфигурации, для анализа в pstats/snakeviz.
+
+    Args:
+        diagnostics_service (DiagnosticsServiceDep): Зависимость сервиса диагностики.
+        limit (int): Число функций в текстовом отчёте.
+
+    Returns:
+        str: Текстовый отчёт cProfile, отсортированный по суммарному времени.
+
+    Raises:
+        HTTPException: Если токен неверен (status_code=403) или сеанс не запущен (status_code=409).
+    """
+    return diagnostics_service.stop_profiling(limit=limit)
+
+
+@router.post(
+    path="/slow-requests/enable/",
+    response_model=AdminResponse,
+    summary="Включение регистрации медленных запросов",
+    description="Включает хранение N самых медленных запросов с замерами вызовов хранилища и снимком стека.",
+    responses={
+        403: {"description": "Admin API is disabled / Invalid admin token"},
+        409: {"description": "Slow request recorder is already enabled"},
+    },
+)
+async def enable_slow_requests(
+    diagnostics_service: DiagnosticsServiceDep,
+    capacity: int = Query(settings.profiler_config.slow_requests_capacity, gt=0),
+    threshold: float = Query(settings.profiler_config.slow_request_threshold, ge=0),
+):
+    """
+    Включает регистрацию медленных запросов.
+
+    Args:
+        diagnostics_service (DiagnosticsServiceDep): Зависимость сервиса диагностики.
+        capacity (int): Сколько самых медленных запросов хранить.
+        threshold (float): Порог длительности запроса в секундах для снятия стека.
+
+    Returns:
+        AdminResponse: Объект с сообщением о включении регистратора.
+
+    Raises:
+        HTTPException: Если токен неверен (status_code=403) или регистратор уже включён (status_code=409).
+    """
+    diagnostics_service.enable_slow_requests(capacity=capacity, threshold=threshold)
+    return AdminResponse(detail="Slow request recorder enabled")
+
+
+@router.post(
+    path="/slow-requests/disable/",
+    response_model=AdminResponse,
+    summary="Выключение регистрации медленных запросов",
+    description="Выключает регистратор; записанные запросы остаются доступны.",
+    responses={
+        403: {"description": "Admin API is disabled / Invalid admin token"},
+        409: {"description": "Slow request recorder is not enabled"},
+    },
+)
+async def disable_slow_requests(
+    diagnostics_service: DiagnosticsServiceDep,
+):
+    """
+    Выключает регистрацию медленных запросов.
+
+    Args:
+        diagnostics_service (DiagnosticsServiceDep): Зависимость сервиса диагностики.
+
+    Returns:
+        AdminResponse: Объект с сообщением о выключении регистратора.
+
+    Raises:
+        HTTPException: Если токен неверен (status_code=403) или регистратор не включён (status_code=409).
+    """
+    diagnostics_service.disable_slow_requests()
+    return AdminResponse(detail="Slow request recorder disabled")
+
+
+@router.get(
+    path="/slow-requests/",
+    response_model=List[SlowRequestSchema],
+    summary="Самые медленные запросы",
+    description="Возвращает записанные медленные запросы по убыванию длительности.",
+    responses={403: {"description": "Admin API is disabled / Invalid admin token"}},
+)
+async def get_slow_requests(
+    diagnostics_service: DiagnosticsServiceDep,
+):
+    """
+    Получает самые медленные запросы, записанные регистратором.
+
+    Args:
+        diagnostics_service (DiagnosticsServiceDep): Зависимость сервиса диагностики.
+
+    Returns:
+        List[SlowRequestSchema]: Записи о запросах по убыванию длительности.
+
+    Raises:
+        HTTPException: Если токен неверен (status_code=403).
+    """
+    return diagnostics_service.get_slow_requests()
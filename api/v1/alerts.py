@@ -0,0 +1,102 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from core.dependencies import AlertServiceDep, verify_admin_token
+from schemas.alerts import AlertDeleteResponse, AlertRuleCreateSchema, AlertRuleSchema
+
+router = APIRouter(prefix="/alerts", dependencies=[Depends(verify_admin_token)])
+
+
+@router.post(
+    path="/",
+    response_model=AlertRuleSchema,
+    summary="Регистрация правила оповещения",
+    description="Регистрирует пороговое правило по курсу пары валют или по общей сумме средств в валюте.",
+    responses={
+        400: {"description": "Unsupported alert target: TARGET"},
+        403: {"description": "Invalid admin token"},
+        409: {"description": "Alert rule limit reached: LIMIT"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def add_alert_rule(
+    rule: AlertRuleCreateSchema,
+    alert_service: AlertServiceDep,
+):
+    """
+    Регистрирует пороговое правило оповещения.
+
+    Правило срабатывает, когда значение цели пересекает порог в заданном направлении;
+    оповещение доставляется на указанный webhook с повторными попытками.
+
+    Args:
+        rule (AlertRuleCreateSchema): Схема с параметрами правила.
+        alert_service (AlertServiceDep): Зависимость сервиса оповещений для обработки запроса.
+
+    Returns:
+        AlertRuleSchema: Зарегистрированное правило с его идентификатором.
+
+    Raises:
+        HTTPException: Если цель правила не поддерживается (status_code=400), достигнут предел числа правил
+            (status_code=409) или произошла внутренняя ошибка сервера (status_code=500).
+    """
+    return alert_service.add_rule(rule=rule)
+
+
+@router.get(
+    path="/",
+    response_model=List[AlertRuleSchema],
+    summary="Получение правил оповещения",
+    description="Возвращает все зарегистрированные правила оповещения.",
+    responses={
+        403: {"description": "Invalid admin token"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def get_alert_rules(
+    alert_service: AlertServiceDep,
+):
+    """
+    Получает все зарегистрированные правила оповещения.
+
+    Args:
+        alert_service (AlertServiceDep): Зависимость сервиса оповещений для обработки запроса.
+
+    Returns:
+        List[AlertRuleSchema]: Список правил.
+    """
+    return alert_service.get_rules()
+
+
+@router.delete(
+    path="/{rule_id}/",
+    response_model=AlertDeleteResponse,
+    summary="Удаление правила оповещения",
+    description="Удаляет правило оповещения по его идентификатору.",
+    responses={
+        403: {"description": "Invalid admin token"},
+        404: {"description": "Alert rule not found"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def remove_alert_rule(
+    rule_id: int,
+    alert_service: AlertServiceDep,
+):
+    """
+    Удаляет правило оповещения по его идентификатору.
+
+    Args:
+        rule_id (int): Идентификатор правила.
+        alert_service (AlertServiceDep): Зависимость сервиса оповещений для обработки запроса.
+
+    Returns:
+        AlertDeleteResponse: Объект с сообщением об успешном удалении правила.
+
+    Raises:
+        HTTPException: Если правило не найдено (status_code=404) или произошла внутренняя ошибка сервера
+            (status_code=500).
+    """
+    alert_service.remove_rule(rule_id=rule_id)
+    return AlertDeleteResponse(detail="The alert rule has been successfully removed")
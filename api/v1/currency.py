@@ -1,12 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
-from core.dependencies import CurrencyServiceDep
+from core.dependencies import CurrencyServiceDep, RequestIdDep
+from core.responses import hot_response
 from schemas.currency import (
     AmountResponse,
     AmountSetSchema,
     AmountUpdateSchema,
     AmountUpdateResponse,
     AmountTotalSchema,
+    ConvertRequestSchema,
+    ConvertResponse,
 )
 
 router = APIRouter()
@@ -17,9 +20,13 @@ router = APIRouter()
     response_model=AmountTotalSchema,
     summary="Получение общей информации о валютах",
     description="Возвращает текущие суммы валют, их курсы и итоговые значения в базовой валюте.",
-    responses={500: {"description": "Internal Server Error"}},
+    responses={
+        500: {"description": "Internal Server Error"},
+        503: {"description": "Exchange rates are not available yet"},
+    },
 )
 async def get_amount(
+    request: Request,
     currency_service: CurrencyServiceDep,
 ):
     """
@@ -29,15 +36,17 @@ async def get_amount(
     и итоговую сумму для каждой валюты в формате, соответствующем OpenAPI.
 
     Args:
+        request (Request): Входящий HTTP-запрос.
         currency_service (CurrencyServiceDep): Зависимость сервиса валют для обработки запроса.
 
     Returns:
         AmountTotalSchema: Объект, содержащий суммы валют, курсы и итоговые значения.
 
     Raises:
-        HTTPException: В случае внутренней ошибки сервера (status_code=500).
+        HTTPException: Если курсы ещё не получены (status_code=503) или произошла внутренняя ошибка сервера
+            (status_code=500).
     """
-    return currency_service.get_total_info()
+    return hot_response(request, currency_service.get_total_info())
 
 
 @router.get(
@@ -52,6 +61,7 @@ async def get_amount(
 )
 async def get_currency(
     currency: str,
+    request: Request,
     currency_service: CurrencyServiceDep,
 ):
     """
@@ -61,6 +71,7 @@ async def get_currency(
 
     Args:
         currency (str): Код валюты (например, USD, EUR, RUB).
+        request (Request): Входящий HTTP-запрос.
         currency_service (CurrencyServiceDep): Зависимость сервиса валют для обработки запроса.
 
     Returns:
@@ -69,7 +80,7 @@ async def get_currency(
     Raises:
         HTTPException: Если валюта не найдена (status_code=404) или произошла внутренняя ошибка сервера (status_code=500).
     """
-    return currency_service.get_by_code(currency_code=currency)
+    return hot_response(request, currency_service.get_by_code(currency_code=currency))
 
 
 @router.post(
@@ -85,6 +96,7 @@ async def get_currency(
 async def set_amount(
     set_amount_values: AmountSetSchema,
     currency_service: CurrencyServiceDep,
+    request_id: RequestIdDep,
 ):
     """
     Устанавливает новые значения сумм для указанных валют.
@@ -95,6 +107,8 @@ async def set_amount(
     Args:
         set_amount_values (AmountSetSchema): Схема с новыми значениями сумм для валют.
         currency_service (CurrencyServiceDep): Зависимость сервиса валют для обработки запроса.
+        request_id (RequestIdDep): Идентификатор запроса из заголовка X-Request-ID или сгенерированный,
+            записывается в журнал операций.
 
     Returns:
         AmountUpdateResponse: Объект с сообщением об успешном обновлении сумм валют.
@@ -102,7 +116,7 @@ async def set_amount(
     Raises:
         HTTPException: Если данные некорректны (status_code=422) или произошла внутренняя ошибка сервера (status_code=500).
     """
-    currency_service.set_amount(set_amount=set_amount_values)
+    currency_service.set_amount(set_amount=set_amount_values, request_id=request_id)
     return AmountUpdateResponse(
         detail="The number of currencies has been successfully updated"
     )
@@ -122,6 +136,7 @@ async def set_amount(
 async def modify_amount(
     update_amount: AmountUpdateSchema,
     currency_service: CurrencyServiceDep,
+    request_id: RequestIdDep,
 ):
     """
     Изменяет суммы валют на основе предоставленных данных.
@@ -132,6 +147,8 @@ async def modify_amount(
     Args:
         update_amount (AmountUpdateSchema): Схема с изменениями сумм для валют.
         currency_service (CurrencyServiceDep): Зависимость сервиса валют для обработки запроса.
+        request_id (RequestIdDep): Идентификатор запроса из заголовка X-Request-ID или сгенерированный,
+            записывается в журнал операций.
 
     Returns:
         AmountUpdateResponse: Объект с сообщением об успешном обновлении сумм валют.
@@ -139,7 +156,41 @@ async def modify_amount(
     Raises:
         HTTPException: Если данные некорректны (status_code=422) или произошла внутренняя ошибка сервера (status_code=500).
     """
-    currency_service.modify_amount(modify_amount=update_amount)
+    currency_service.modify_amount(modify_amount=update_amount, request_id=request_id)
     return AmountUpdateResponse(
         detail="The number of currencies has been successfully updated"
     )
+
+
+@router.post(
+    path="/convert/",
+    response_model=ConvertResponse,
+    summary="Пакетная конвертация сумм",
+    description="Конвертирует список сумм между валютами по текущим кросс-курсам.",
+    responses={
+        404: {"description": "Currency pair not supported: FROM-TO"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def convert(
+    convert_request: ConvertRequestSchema,
+    currency_service: CurrencyServiceDep,
+):
+    """
+    Конвертирует набор сумм между валютами.
+
+    Каждый элемент обрабатывается одним обращением к предрассчитанной таблице кросс-курсов
+    и одним умножением; результаты возвращаются в порядке входного списка.
+
+    Args:
+        convert_request (ConvertRequestSchema): Схема со списком элементов {from, to, amount}.
+        currency_service (CurrencyServiceDep): Зависимость сервиса валют для обработки запроса.
+
+    Returns:
+        ConvertResponse: Объект со списком сконвертированных сумм.
+
+    Raises:
+        HTTPException: Если пара валют не поддерживается (status_code=404) или произошла внутренняя ошибка сервера
+            (status_code=500).
+    """
+    return currency_service.convert(items=convert_request.items)
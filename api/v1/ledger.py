@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Query
+
+from core.config import settings
+from core.dependencies import LedgerServiceDep
+from schemas.ledger import LedgerPageResponse
+
+router = APIRouter(prefix="/ledger")
+
+
+@router.get(
+    path="/",
+    response_model=LedgerPageResponse,
+    summary="Журнал операций с балансами",
+    description="Возвращает страницу журнала операций с балансами валют с фильтром по валюте и интервалу времени.",
+    responses={
+        404: {"description": "Currency not supported"},
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def get_ledger(
+    ledger_service: LedgerServiceDep,
+    code: Optional[str] = None,
+    from_: Annotated[Optional[datetime], Query(alias="from")] = None,
+    to: Optional[datetime] = None,
+    cursor: Annotated[Optional[int], Query(ge=0)] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.ledger_config.max_page_size)
+    ] = settings.ledger_config.page_size,
+):
+    """
+    Получает страницу журнала операций с балансами валют.
+
+    Записи возвращаются в порядке выполнения операций. Для получения следующей страницы
+    запрос повторяется с теми же фильтрами и курсором next_cursor из ответа.
+
+    Args:
+        ledger_service (LedgerServiceDep): Зависимость сервиса журнала для обработки запроса.
+        code (Optional[str]): Код валюты; по умолчанию — операции всех валют.
+        from_ (Optional[datetime]): Начало интервала времени включительно (параметр from).
+        to (Optional[datetime]): Конец интервала времени включительно.
+        cursor (Optional[int]): Курсор из предыдущего ответа.
+        limit (int): Максимальное число записей на странице.
+
+    Returns:
+        LedgerPageResponse: Записи страницы и курсор следующей страницы.
+
+    Raises:
+        HTTPException: Если валюта не поддерживается (status_code=404) или произошла внутренняя ошибка
+            сервера (status_code=500).
+    """
+    return ledger_service.get_page(
+        code=code, start=from_, end=to, cursor=cursor, limit=limit
+    )
@@ -1,4 +1,12 @@
-from .fetch_service import FetchService
+def __getattr__(name):
+    # FetchService тянет за собой httpx; импорт откладывается, чтобы core.config
+    # и другие лёгкие модули пакета не загружали его при разборе аргументов CLI
+    if name == "FetchService":
+        from .fetch_service import FetchService
+
+        return FetchService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "FetchService",
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict
+
+from core.config import settings
+
+logger = logging.getLogger(settings.logger.logger_name)
+
+READ = "read"
+WRITE = "write"
+
+
+class AdmissionController:
+    """
+    Контроль допуска запросов: ограничивает число одновременно обрабатываемых запросов
+    по классам (чтение/запись), держит ограниченную очередь ожидания и отбрасывает запросы,
+    которые не дождались обработки за отведённое время.
+
+    Запросы на запись имеют приоритет: освободившийся слот сначала отдаётся ожидающей записи,
+    а при переполненной очереди запись вытесняет самый поздний ожидающий запрос на чтение.
+    """
+
+    def __init__(
+        self,
+        max_active: int,
+        read_limit: int,
+        write_limit: int,
+        max_queue: int,
+        queue_timeout: float,
+    ) -> None:
+        """
+        Инициализирует экземпляр класса AdmissionController.
+
+        :param max_active: Общий предел одновременно обрабатываемых запросов.
+        :param read_limit: Предел одновременно обрабатываемых запросов на чтение.
+        :param write_limit: Предел одновременно обрабатываемых запросов на запись.
+        :param max_queue: Максимальное число запросов, ожидающих в очереди.
+        :param queue_timeout: Максимальное время ожидания в очереди в секундах.
+        """
+        self._max_active = max_active
+        self._limits = {READ: read_limit, WRITE: write_limit}
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        self._priority = (WRITE, READ)
+
+        self._active_total = 0
+        self._active: Dict[str, int] = {READ: 0, WRITE: 0}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {
+            READ: deque(),
+            WRITE: deque(),
+        }
+        self._queued: Dict[str, int] = {READ: 0, WRITE: 0}
+        self._admitted: Dict[str, int] = {READ: 0, WRITE: 0}
+        self._shed: Dict[str, int] = {READ: 0, WRITE: 0}
+
+    def _can_admit(self, kind: str) -> bool:
+        """
+        Проверяет, есть ли свободный слот для запроса указанного класса.
+
+        :param kind: Класс запроса (READ или WRITE).
+        """
+        return (
+            self._active_total < self._max_active
+            and self._active[kind] < self._limits[kind]
+        )
+
+    def _admit(self, kind: str) -> None:
+        """
+        Занимает слот для запроса указанного класса.
+
+        :param kind: Класс запроса (READ или WRITE).
+        """
+        self._active_total += 1
+        self._active[kind] += 1
+        self._admitted[kind] += 1
+
+    def _wake(self) -> None:
+        """
+        Раздаёт свободные слоты ожидающим запросам в порядке приоритета классов.
+        """
+        for kind in self._priority:
+            waiters = self._waiters[kind]
+            while waiters and self._can_admit(kind):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                self._admit(kind)
+                future.set_result(True)
+
+    def _evict_read(self) -> bool:
+        """
+        Вытесняет самый поздний ожидающий запрос на чтение, освобождая место в очереди.
+
+        :return: True, если запрос был вытеснен.
+        """
+        waiters = self._waiters[READ]
+        while waiters:
+            future = waiters.pop()
+            if not future.done():
+                future.set_result(False)
+                return True
+        return False
+
+    async def acquire(self, kind: str) -> bool:
+        """
+        Пытается занять слот для запроса, при необходимости ожидая в очереди.
+
+        :param kind: Класс запроса (READ или WRITE).
+        :return: True, если запрос допущен к обработке; False, если запрос отброшен.
+        """
+        if not self._waiters[kind] and self._can_admit(kind):
+            self._admit(kind)
+            return True
+
+        queued = self._queued[READ] + self._queued[WRITE]
+        if queued >= self._max_queue and not (kind == WRITE and self._evict_read()):
+            self._shed[kind] += 1
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[kind].append(future)
+        self._queued[kind] += 1
+        try:
+            admitted = await asyncio.wait_for(future, timeout=self._queue_timeout)
+        except asyncio.TimeoutError:
+            # Слот мог быть выдан в том же шаге цикла, что и истёк таймаут: тогда запрос уже допущен
+            admitted = future.done() and not future.cancelled() and future.result()
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.result():
+                self.release(kind)
+            raise
+        finally:
+            self._queued[kind] -= 1
+
+        if not admitted:
+            self._shed[kind] += 1
+        return admitted
+
+    def release(self, kind: str) -> None:
+        """
+        Освобождает слот после обработки запроса и передаёт его ожидающим.
+
+        :param kind: Класс запроса (READ или WRITE).
+        """
+        self._active_total -= 1
+        self._active[kind] -= 1
+        self._wake()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Возвращает текущее состояние контроля допуска.
+
+        :return: Словарь с ключами "active", "queued", "admitted" и "shed" по классам запросов.
+        """
+        return {
+            "active": dict(self._active),
+            "queued": dict(self._queued),
+            "admitted": dict(self._admitted),
+            "shed": dict(self._shed),
+        }
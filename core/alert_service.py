@@ -0,0 +1,91 @@
+from typing import List
+
+from fastapi import HTTPException, status
+
+from core.alerts import RATE, AlertEngine, AlertRule
+from core.config import settings
+from core.store import BalanceStore
+from schemas.alerts import AlertRuleCreateSchema
+
+
+class AlertService:
+    """
+    Сервис для регистрации, получения и удаления пороговых правил оповещения.
+    """
+
+    def __init__(self, engine: AlertEngine, store: BalanceStore) -> None:
+        """
+        Инициализирует экземпляр класса AlertService.
+
+        :param engine: Экземпляр AlertEngine с реестром правил.
+        :param store: Экземпляр BalanceStore, по данным которого проверяются правила.
+        """
+        self._engine = engine
+        self._store = store
+
+    @staticmethod
+    def _normalize_target(kind: str, target: str) -> str:
+        """
+        Приводит цель правила к верхнему регистру и проверяет, что валюты поддерживаются.
+
+        :param kind: Тип правила.
+        :param target: Пара валют вида "USD-RUB" или код валюты.
+        :return: Нормализованная цель.
+        :raises HTTPException: Если цель не поддерживается (код 400).
+        """
+        target = target.upper()
+        codes = target.split("-") if kind == RATE else [target]
+        supported = {cur.upper() for cur in settings.currencies}
+        if (kind == RATE and len(codes) != 2) or not set(codes) <= supported:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported alert target: {target}",
+            )
+        return target
+
+    def add_rule(self, rule: AlertRuleCreateSchema) -> AlertRule:
+        """
+        Регистрирует новое правило оповещения.
+
+        :param rule: Схема AlertRuleCreateSchema с параметрами правила.
+        :return: Зарегистрированное правило.
+        :raises HTTPException: Если цель правила не поддерживается (код 400)
+            или достигнут предел числа правил (код 409).
+        """
+        max_rules = settings.alerts_config.max_rules
+        if len(self._engine.rules) >= max_rules:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Alert rule limit reached: {max_rules}",
+            )
+        return self._engine.add_rule(
+            store=self._store,
+            kind=rule.kind,
+            target=self._normalize_target(rule.kind, rule.target),
+            direction=rule.direction,
+            threshold=rule.threshold,
+            webhook_url=str(rule.webhook_url),
+        )
+
+    def get_rules(self) -> List[AlertRule]:
+        """
+        Получает все зарегистрированные правила.
+
+        :return: Список правил.
+        """
+        return list(self._engine.rules.values())
+
+    def remove_rule(self, rule_id: int) -> None:
+        """
+        Удаляет правило оповещения.
+
+        :param rule_id: Идентификатор правила.
+        :raises HTTPException: Если правило не найдено (код 404).
+        """
+        try:
+            self._engine.remove_rule(rule_id)
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Alert rule not found",
+            )
@@ -0,0 +1,360 @@
+import asyncio
+import itertools
+import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from core.config import settings
+from core.store import BalanceStore, StoreSnapshot
+
+logger = logging.getLogger(settings.logger.logger_name)
+
+RATE = "rate"
+TOTAL = "total"
+ABOVE = "above"
+BELOW = "below"
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    Пороговое правило оповещения.
+
+    Для правила типа RATE цель — пара валют вида "USD-RUB", для TOTAL — код валюты,
+    в которой считается общая сумма средств.
+    """
+
+    id: int
+    kind: str
+    target: str
+    direction: str
+    threshold: Decimal
+    webhook_url: str
+
+
+class ThresholdIndex:
+    """
+    Отсортированный индекс порогов правил для одной цели и одного направления.
+
+    Пороги и идентификаторы правил хранятся в параллельных списках, поэтому поиск сработавших
+    правил выполняется бинарным поиском, а не перебором всех правил.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализирует пустой индекс.
+        """
+        self.thresholds: List[Decimal] = []
+        self.rule_ids: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+    def add(self, threshold: Decimal, rule_id: int) -> None:
+        """
+        Добавляет правило в индекс с сохранением порядка порогов.
+
+        :param threshold: Порог правила.
+        :param rule_id: Идентификатор правила.
+        """
+        i = bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(i, threshold)
+        self.rule_ids.insert(i, rule_id)
+
+    def remove(self, threshold: Decimal, rule_id: int) -> None:
+        """
+        Удаляет правило из индекса.
+
+        :param threshold: Порог правила.
+        :param rule_id: Идентификатор правила.
+        """
+        i = bisect_left(self.thresholds, threshold)
+        while self.rule_ids[i] != rule_id:
+            i += 1
+        del self.thresholds[i]
+        del self.rule_ids[i]
+
+    def crossed_above(self, previous: Optional[Decimal], current: Decimal) -> List[int]:
+        """
+        Находит правила, порог которых значение пересекло снизу вверх.
+
+        :param previous: Предыдущее значение или None, если значения ещё не было.
+        :param current: Новое значение.
+        :return: Идентификаторы правил с порогом в интервале [previous, current).
+        """
+        start = 0 if previous is None else bisect_left(self.thresholds, previous)
+        end = bisect_left(self.thresholds, current)
+        return self.rule_ids[start:end]
+
+    def crossed_below(self, previous: Optional[Decimal], current: Decimal) -> List[int]:
+        """
+        Находит правила, порог которых значение пересекло сверху вниз.
+
+        :param previous: Предыдущее значение или None, если значения ещё не было.
+        :param current: Новое значение.
+        :return: Идентификаторы правил с порогом в интервале (current, previous].
+        """
+        start = bisect_right(self.thresholds, current)
+        end = (
+            len(self.thresholds)
+            if previous is None
+            else bisect_right(self.thresholds, previous)
+        )
+        return self.rule_ids[start:end]
+
+
+class WebhookDispatcher:
+    """
+    Очередь доставки сработавших оповещений на webhook с повторными попытками.
+
+    Очередь разбирают несколько обработчиков, поэтому медленный или недоступный получатель
+    не задерживает доставку остальных оповещений.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализирует экземпляр класса WebhookDispatcher.
+        """
+        config = settings.alerts_config
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        self._max_retries = config.max_retries
+        self._retry_backoff = config.retry_backoff
+        self._webhook_timeout = config.webhook_timeout
+        self._workers = config.workers
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        HTTP-клиент, создаваемый при первой доставке оповещения.
+
+        Без правил оповещения клиент не нужен, а его создание загружает сертификаты TLS
+        и замедляет запуск сервиса.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._webhook_timeout)
+        return self._client
+
+    def enqueue(self, url: str, payload: Dict[str, Any], attempt: int = 0) -> None:
+        """
+        Ставит оповещение в очередь доставки.
+
+        :param url: Адрес webhook.
+        :param payload: Тело оповещения.
+        :param attempt: Номер попытки доставки.
+        """
+        try:
+            self._queue.put_nowait((url, payload, attempt))
+        except asyncio.QueueFull:
+            logger.warning("Alert queue is full, dropping alert: %s", payload)
+
+    async def _deliver(self, url: str, payload: Dict[str, Any], attempt: int) -> None:
+        """
+        Отправляет оповещение и при ошибке планирует повторную попытку с экспоненциальной задержкой.
+
+        :param url: Адрес webhook.
+        :param payload: Тело оповещения.
+        :param attempt: Номер попытки доставки.
+        """
+        try:
+            response = await self.client.post(url, json=payload)
+            response.raise_for_status()
+        except Exception as e:
+            if attempt >= self._max_retries:
+                logger.error("Alert delivery to %s failed: %s", url, e)
+                return
+            delay = self._retry_backoff * 2**attempt
+            logger.warning("Alert delivery to %s failed, retry in %ss", url, delay)
+            asyncio.get_running_loop().call_later(
+                delay, self.enqueue, url, payload, attempt + 1
+            )
+
+    async def _worker(self) -> None:
+        """
+        Доставляет оповещения из очереди по одному до отмены задачи.
+        """
+        while True:
+            url, payload, attempt = await self._queue.get()
+            await self._deliver(url, payload, attempt)
+
+    async def run(self) -> None:
+        """
+        Обрабатывает очередь доставки несколькими параллельными обработчиками до отмены задачи.
+        """
+        try:
+            await asyncio.gather(*(self._worker() for _ in range(self._workers)))
+        except asyncio.CancelledError:
+            return
+
+    async def aclose(self) -> None:
+        """
+        Закрывает HTTP-клиент, если он был создан.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+
+
+class AlertEngine:
+    """
+    Реестр пороговых правил оповещения, проиндексированных по цели (паре валют или валюте общей суммы).
+
+    При изменении курсов пересчитываются только правила по парам и общим суммам, при изменении
+    количеств — только правила по общим суммам. Правило срабатывает, когда значение пересекает
+    порог в заданном направлении.
+    """
+
+    def __init__(self, dispatcher: WebhookDispatcher) -> None:
+        """
+        Инициализирует экземпляр класса AlertEngine.
+
+        :param dispatcher: Очередь доставки сработавших оповещений.
+        """
+        self._dispatcher = dispatcher
+        self._ids = itertools.count(1)
+        self.rules: Dict[int, AlertRule] = {}
+        self._index: Dict[Tuple[str, str], Dict[str, ThresholdIndex]] = {}
+        self._last: Dict[Tuple[str, str], Decimal] = {}
+
+    @staticmethod
+    def _value(
+        store: BalanceStore, snapshot: StoreSnapshot, kind: str, target: str
+    ) -> Optional[Decimal]:
+        """
+        Получает значение цели правила в снимке хранилища.
+
+        :param store: Экземпляр BalanceStore.
+        :param snapshot: Снимок состояния хранилища.
+        :param kind: Тип правила (RATE или TOTAL).
+        :param target: Пара валют или код валюты.
+        :return: Значение или None, если его нельзя рассчитать; общая сумма не рассчитывается,
+            пока у какой-либо валюты нет курса.
+        """
+        if kind == RATE:
+            src, dst = target.split("-")
+            return snapshot.cross_rates.get((src, dst))
+        if store.unresolved(snapshot):
+            return None
+        return store.totals(snapshot).get(target)
+
+    def add_rule(
+        self,
+        store: BalanceStore,
+        kind: str,
+        target: str,
+        direction: str,
+        threshold: Decimal,
+        webhook_url: str,
+    ) -> AlertRule:
+        """
+        Регистрирует правило и сразу проверяет его по текущему значению цели.
+
+        :param store: Экземпляр BalanceStore.
+        :param kind: Тип правила (RATE или TOTAL).
+        :param target: Пара валют вида "USD-RUB" или код валюты.
+        :param direction: Направление пересечения порога (ABOVE или BELOW).
+        :param threshold: Порог.
+        :param webhook_url: Адрес webhook для доставки оповещения.
+        :return: Зарегистрированное правило.
+        """
+        rule = AlertRule(
+            id=next(self._ids),
+            kind=kind,
+            target=target,
+            direction=direction,
+            threshold=threshold,
+            webhook_url=webhook_url,
+        )
+        self.rules[rule.id] = rule
+        key = (kind, target)
+        by_direction = self._index.setdefault(
+            key, {ABOVE: ThresholdIndex(), BELOW: ThresholdIndex()}
+        )
+        by_direction[direction].add(threshold, rule.id)
+
+        value = self._value(store, store.snapshot(), kind, target)
+        if value is not None:
+            self._last.setdefault(key, value)
+            if (direction == ABOVE and value > threshold) or (
+                direction == BELOW and value < threshold
+            ):
+                self._fire(rule, value)
+        return rule
+
+    def remove_rule(self, rule_id: int) -> None:
+        """
+        Удаляет правило.
+
+        :param rule_id: Идентификатор правила.
+        :raises KeyError: Если правило не найдено.
+        """
+        rule = self.rules.pop(rule_id)
+        key = (rule.kind, rule.target)
+        by_direction = self._index[key]
+        by_direction[rule.direction].remove(rule.threshold, rule.id)
+        if not by_direction[ABOVE] and not by_direction[BELOW]:
+            del self._index[key]
+            self._last.pop(key, None)
+
+    def on_store_update(self, store: BalanceStore, rates_changed: bool) -> None:
+        """
+        Проверяет правила, затронутые изменением данных хранилища.
+
+        :param store: Экземпляр BalanceStore.
+        :param rates_changed: True, если изменились курсы; False, если изменились только количества.
+        """
+        snapshot = store.snapshot()
+        if not self._index or not snapshot.rates:
+            return
+
+        totals = None
+        for key, by_direction in self._index.items():
+            kind, target = key
+            if kind == RATE:
+                if not rates_changed:
+                    continue
+                value = self._value(store, snapshot, kind, target)
+            else:
+                if totals is None:
+                    totals = (
+                        {} if store.unresolved(snapshot) else store.totals(snapshot)
+                    )
+                value = totals.get(target)
+            if value is None:
+                continue
+
+            previous = self._last.get(key)
+            self._last[key] = value
+            if previous == value:
+                continue
+            fired: List[int] = []
+            if previous is None or value > previous:
+                fired += by_direction[ABOVE].crossed_above(previous, value)
+            if previous is None or value < previous:
+                fired += by_direction[BELOW].crossed_below(previous, value)
+            for rule_id in fired:
+                self._fire(self.rules[rule_id], value)
+
+    def _fire(self, rule: AlertRule, value: Decimal) -> None:
+        """
+        Ставит оповещение о сработавшем правиле в очередь доставки.
+
+        :param rule: Сработавшее правило.
+        :param value: Значение цели, при котором правило сработало.
+        """
+        self._dispatcher.enqueue(
+            rule.webhook_url,
+            {
+                "rule_id": rule.id,
+                "kind": rule.kind,
+                "target": rule.target,
+                "direction": rule.direction,
+                "threshold": str(rule.threshold),
+                "value": str(value),
+                "fired_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
@@ -18,13 +19,73 @@ class LoggerConfig(BaseModel):
     log_file: str = BASE_DIR / "app.log"
 
 
+class ProviderConfig(BaseModel):
+    name: str
+    url: str
+    format: Literal["cbr", "base_rates"] = "base_rates"
+    cost: float = 2.0
+
+
 class FetchConfig(BaseModel):
     fetch_url: str = "https://www.cbr-xml-daily.ru/daily_json.js"
     fetch_timeout: int = 10
+    fetch_cost: float = 1.0
+    extra_providers: list[ProviderConfig] = []
+    staleness_penalty: float = 0.1  # Cost per hour of quote age
+
+
+class CacheConfig(BaseModel):
+    rates_file: Path = BASE_DIR / "rates_cache.json"
 
 
 class SchedulerConfig(BaseModel):
     print_sleep: int = 1  # Minutes
+    full_dump_interval: int = 60  # Minutes
+
+
+class LedgerConfig(BaseModel):
+    segment_size: int = 10000  # Entries per segment
+    max_memory_segments: int = 8
+    spill_dir: Path = BASE_DIR / "ledger"
+    page_size: int = 100
+    max_page_size: int = 1000
+
+
+class AdmissionConfig(BaseModel):
+    enabled: bool = True
+    path_prefix: str = "/api/v1"
+    max_active: int = 64
+    read_limit: int = 48
+    write_limit: int = 32
+    max_queue: int = 256
+    queue_timeout: float = 1.0  # Seconds
+    retry_after: int = 1  # Seconds
+
+
+class AlertsConfig(BaseModel):
+    webhook_timeout: float = 5.0  # Seconds
+    max_retries: int = 5
+    retry_backoff: float = 1.0  # Seconds
+    queue_size: int = 10000
+    workers: int = 4
+    max_rules: int = 100_000
+
+
+class ProfilerConfig(BaseModel):
+    dump_file: Path = BASE_DIR / "profile.prof"
+    report_limit: int = 50
+    slow_requests_capacity: int = 20
+    slow_request_threshold: float = 0.5  # Seconds
+    sample_interval: float = 0.01  # Seconds
+
+
+class PerfConfig(BaseModel):
+    access_log_sample_rate: float = 0.01
+    access_log_buffer: int = 1000
+
+
+class AdminConfig(BaseModel):
+    token: Optional[str] = None
 
 
 class Settings(BaseSettings):
@@ -45,8 +106,29 @@ class Settings(BaseSettings):
     # Fetch
     fetch_config: FetchConfig = FetchConfig()
 
+    # Last-known-good rates cache
+    cache_config: CacheConfig = CacheConfig()
+
     # Schedulers
     scheduler_config: SchedulerConfig = SchedulerConfig()
 
+    # Balance operations ledger
+    ledger_config: LedgerConfig = LedgerConfig()
+
+    # Admission control
+    admission_config: AdmissionConfig = AdmissionConfig()
+
+    # Alerts
+    alerts_config: AlertsConfig = AlertsConfig()
+
+    # Profiling
+    profiler_config: ProfilerConfig = ProfilerConfig()
+
+    # High-performance runtime profile
+    perf_config: PerfConfig = PerfConfig()
+
+    # Admin API
+    admin_config: AdminConfig = AdminConfig()
+
 
 settings = Settings()
@@ -1,11 +1,17 @@
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
 
 from core.store import BalanceStore
 from utils.abstracts import AbstractCurrencyService
-from schemas.currency import AmountResponse, AmountUpdateSchema
+from schemas.currency import (
+    AmountResponse,
+    AmountUpdateSchema,
+    ConvertItemSchema,
+    ConvertResponse,
+)
 
 
 class CurrencyService(AbstractCurrencyService):
@@ -31,33 +37,45 @@ class CurrencyService(AbstractCurrencyService):
         :raises HTTPException: Если валюта не поддерживается (код 404).
         """
         currency_code = currency_code.upper()
-        if currency_code not in self._store.amounts:
+        currency_amount = self._store.get_amount(currency_code=currency_code)
+        if currency_amount is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Currency not supported",
             )
 
-        currency_amount = self._store.get_amount(currency_code=currency_code)
         return AmountResponse(name=currency_code, value=currency_amount)
 
-    def set_amount(self, set_amount: AmountUpdateSchema) -> None:
+    def set_amount(
+        self, set_amount: AmountUpdateSchema, request_id: Optional[str] = None
+    ) -> None:
         """
         Устанавливает новое количество для указанных валют.
 
+        Валюты, не указанные в запросе, не изменяются.
+
         :param set_amount: Схема AmountUpdateSchema с информацией о валютах и их новых количествах.
+        :param request_id: Идентификатор запроса для записи в журнал операций.
         """
-        set_amount_dict = set_amount.model_dump()
-        self._store.set_amount(new_amounts=set_amount_dict)
+        set_amount_dict = set_amount.model_dump(exclude_none=True)
+        self._store.set_amount(new_amounts=set_amount_dict, request_id=request_id)
 
-    def modify_amount(self, modify_amount: AmountUpdateSchema) -> None:
+    def modify_amount(
+        self, modify_amount: AmountUpdateSchema, request_id: Optional[str] = None
+    ) -> None:
         """
         Изменяет количество указанных валют на заданную величину.
 
+        Валюты, не указанные в запросе, не изменяются.
+
         :param modify_amount: Схема AmountUpdateSchema с информацией о валютах и величинах изменения их количества.
+        :param request_id: Идентификатор запроса для записи в журнал операций.
         """
         try:
-            modify_amount_dict = modify_amount.model_dump()
-            self._store.modify_amount(modify_amounts=modify_amount_dict)
+            modify_amount_dict = modify_amount.model_dump(exclude_none=True)
+            self._store.modify_amount(
+                modify_amounts=modify_amount_dict, request_id=request_id
+            )
         except ValueError as e:
             code = e.args[1]
             raise HTTPException(
@@ -69,6 +87,38 @@ class CurrencyService(AbstractCurrencyService):
         """
         Получает сводную информацию о всех валютах, включая их количества, курсы обмена и общие суммы в базовых валютах.
 
-        :return: Словарь с ключами "amounts", "rates" и "total", содержащий соответствующие данные.
+        :return: Словарь с ключами "amounts", "rates", "total", "unresolved", "rates_updated_at" и "rates_age".
+        :raises HTTPException: Если курсы ещё не получены (код 503).
         """
-        return self._store.summary()
+        snapshot = self._store.snapshot()
+        if not snapshot.rates:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Exchange rates are not available yet",
+            )
+
+        summary = self._store.summary(snapshot)
+        rates_age = datetime.now(timezone.utc) - summary["rates_updated_at"]
+        return {**summary, "rates_age": rates_age.total_seconds()}
+
+    def convert(self, items: List[ConvertItemSchema]) -> ConvertResponse:
+        """
+        Конвертирует набор сумм между валютами по текущим кросс-курсам.
+
+        :param items: Список схем ConvertItemSchema с исходной валютой, целевой валютой и суммой.
+        :return: Объект ConvertResponse со сконвертированными суммами в порядке входных данных.
+        :raises HTTPException: Если для пары валют нет курса (код 404).
+        """
+        try:
+            values = self._store.convert(
+                items=[
+                    (item.from_.upper(), item.to.upper(), item.amount) for item in items
+                ]
+            )
+        except KeyError as e:
+            src, dst = e.args[0]
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Currency pair not supported: {src}-{dst}",
+            )
+        return ConvertResponse(values=values)
@@ -1,20 +1,94 @@
-from typing import Annotated
+import secrets
+import uuid
+from typing import Annotated, Optional
 
-from fastapi import Depends, Request
+from fastapi import Depends, Header, HTTPException, Request, status
 
+from core.admission import AdmissionController
+from core.alert_service import AlertService
+from core.alerts import AlertEngine
+from core.config import settings
 from core.currency_service import CurrencyService
+from core.diagnostics_service import DiagnosticsService
+from core.ledger import Ledger
+from core.ledger_service import LedgerService
 from core.store import BalanceStore
 
 
-def get_store(request: Request) -> BalanceStore:
+async def get_store(request: Request) -> BalanceStore:
     store = getattr(request.app.state, "store", None)
     return store
 
 
-def get_currency_service(
+async def get_currency_service(
     store: BalanceStore = Depends(get_store),
 ) -> CurrencyService:
     return CurrencyService(store=store)
 
 
 CurrencyServiceDep = Annotated[CurrencyService, Depends(get_currency_service)]
+
+
+async def get_request_id(
+    x_request_id: Annotated[Optional[str], Header()] = None,
+) -> str:
+    return x_request_id or uuid.uuid4().hex
+
+
+async def get_ledger(request: Request) -> Ledger:
+    ledger = getattr(request.app.state, "ledger", None)
+    return ledger
+
+
+async def get_ledger_service(
+    ledger: Ledger = Depends(get_ledger),
+    store: BalanceStore = Depends(get_store),
+) -> LedgerService:
+    return LedgerService(ledger=ledger, store=store)
+
+
+def get_alert_engine(request: Request) -> AlertEngine:
+    alerts = getattr(request.app.state, "alerts", None)
+    return alerts
+
+
+def get_alert_service(
+    engine: AlertEngine = Depends(get_alert_engine),
+    store: BalanceStore = Depends(get_store),
+) -> AlertService:
+    return AlertService(engine=engine, store=store)
+
+
+def get_admission(request: Request) -> AdmissionController:
+    admission = getattr(request.app.state, "admission", None)
+    return admission
+
+
+def get_diagnostics_service(request: Request) -> DiagnosticsService:
+    return DiagnosticsService(
+        profiler=request.app.state.profiler,
+        recorder=request.app.state.slow_requests,
+    )
+
+
+def verify_admin_token(
+    x_admin_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    token = settings.admin_config.token
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled",
+        )
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token",
+        )
+
+
+AlertServiceDep = Annotated[AlertService, Depends(get_alert_service)]
+AdmissionDep = Annotated[AdmissionController, Depends(get_admission)]
+RequestIdDep = Annotated[str, Depends(get_request_id)]
+LedgerServiceDep = Annotated[LedgerService, Depends(get_ledger_service)]
+DiagnosticsServiceDep = Annotated[DiagnosticsService, Depends(get_diagnostics_service)]
@@ -0,0 +1,77 @@
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, status
+
+from core.profiler import Profiler, SlowRequestRecorder
+
+
+class DiagnosticsService:
+    """
+    Сервис для профилирования приложения и регистрации медленных запросов во время работы.
+    """
+
+    def __init__(self, profiler: Profiler, recorder: SlowRequestRecorder) -> None:
+        """
+        Инициализирует экземпляр класса DiagnosticsService.
+
+        :param profiler: Экземпляр Profiler для сеансов cProfile.
+        :param recorder: Экземпляр SlowRequestRecorder для регистрации медленных запросов.
+        """
+        self._profiler = profiler
+        self._recorder = recorder
+
+    def start_profiling(self) -> None:
+        """
+        Запускает сеанс профилирования.
+
+        :raises HTTPException: Если сеанс уже запущен (код 409).
+        """
+        try:
+            self._profiler.start()
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    def stop_profiling(self, limit: int) -> str:
+        """
+        Останавливает сеанс профилирования.
+
+        :param limit: Число функций в текстовом отчёте.
+        :return: Текстовый отчёт cProfile, отсортированный по суммарному времени.
+        :raises HTTPException: Если сеанс не запущен (код 409).
+        """
+        try:
+            return self._profiler.stop(limit=limit)
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    def enable_slow_requests(self, capacity: int, threshold: float) -> None:
+        """
+        Включает регистрацию медленных запросов.
+
+        :param capacity: Сколько самых медленных запросов хранить.
+        :param threshold: Порог длительности запроса в секундах для снятия стека.
+        :raises HTTPException: Если регистратор уже включён (код 409).
+        """
+        try:
+            self._recorder.enable(capacity=capacity, threshold=threshold)
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    def disable_slow_requests(self) -> None:
+        """
+        Выключает регистрацию медленных запросов.
+
+        :raises HTTPException: Если регистратор не включён (код 409).
+        """
+        try:
+            self._recorder.disable()
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    def get_slow_requests(self) -> List[Dict[str, Any]]:
+        """
+        Получает записанные медленные запросы.
+
+        :return: Список записей, отсортированный по убыванию длительности.
+        """
+        return self._recorder.records()
@@ -1,59 +1,203 @@
+import asyncio
 import logging
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Dict, List, Optional
 
 import httpx
 
-from core.config import settings
-from schemas.fetch import ExchangeRateResponse
+from core.config import ProviderConfig, settings
+from core.rate_graph import ANCHOR, Quote, ResolvedRates, resolve_rates
+from schemas.fetch import BaseRatesResponse, ExchangeRateResponse
 from utils.abstracts import AbstractFetchService
 
 logger = logging.getLogger(settings.logger.logger_name)
 
 
+def parse_cbr_quotes(
+    data: dict, provider: str = "cbr", cost: Optional[float] = None
+) -> List[Quote]:
+    """
+    Извлекает котировки к рублю из ответа API ЦБ РФ.
+
+    :param data: Разобранный JSON в формате daily_json.js.
+    :param provider: Имя поставщика.
+    :param cost: Стоимость котировок поставщика; по умолчанию — fetch_cost из конфигурации.
+    :return: Список котировок вида 1 валюта = N рублей с учётом номинала.
+    """
+    parsed = ExchangeRateResponse(**data)
+    if cost is None:
+        cost = settings.fetch_config.fetch_cost
+    return [
+        Quote(
+            base=code,
+            quote=ANCHOR,
+            rate=valute.Value / valute.Nominal,
+            provider=provider,
+            cost=cost,
+            published_at=parsed.Timestamp,
+        )
+        for code, valute in parsed.Valute.items()
+    ]
+
+
+def parse_base_rates_quotes(data: dict, provider: str, cost: float) -> List[Quote]:
+    """
+    Извлекает котировки из ответа в формате {"base": ..., "rates": {...}}.
+
+    :param data: Разобранный JSON с базовой валютой и курсами к ней.
+    :param provider: Имя поставщика.
+    :param cost: Стоимость котировок поставщика.
+    :return: Список котировок вида 1 базовая валюта = N единиц валюты.
+    """
+    parsed = BaseRatesResponse(**data)
+    if parsed.time_last_update_unix is not None:
+        published_at = datetime.fromtimestamp(
+            parsed.time_last_update_unix, timezone.utc
+        )
+    elif parsed.date is not None:
+        published_at = datetime(*parsed.date.timetuple()[:3], tzinfo=timezone.utc)
+    else:
+        published_at = None
+    base = parsed.base.upper()
+    return [
+        Quote(
+            base=base,
+            quote=code.upper(),
+            rate=rate,
+            provider=provider,
+            cost=cost,
+            published_at=published_at,
+        )
+        for code, rate in parsed.rates.items()
+        if rate > 0 and code.upper() != base
+    ]
+
+
+def resolve_configured_rates(quotes: List[Quote]) -> ResolvedRates:
+    """
+    Рассчитывает курсы валют из конфигурации по графу котировок и логирует валюты без курса.
+
+    :param quotes: Котировки всех поставщиков.
+    :return: Курсы к рублю и цепочки котировок для каждой достижимой валюты.
+    """
+    currencies = [currency.upper() for currency in settings.currencies]
+    if ANCHOR not in currencies:
+        currencies.append(ANCHOR)
+    resolved = resolve_rates(
+        quotes=quotes,
+        currencies=currencies,
+        now=datetime.now(timezone.utc),
+        staleness_penalty=settings.fetch_config.staleness_penalty,
+    )
+    missing = [code for code in currencies if code not in resolved.rates]
+    if missing:
+        logger.warning("No rate path for currencies: %s", ", ".join(missing))
+    return resolved
+
+
+def parse_rates(data: dict) -> Dict[str, Decimal]:
+    """
+    Извлекает курсы настроенных валют из ответа API ЦБ РФ.
+
+    :param data: Разобранный JSON в формате daily_json.js.
+    :return: Словарь с кодами валют и их курсами к рублю.
+    """
+    return resolve_configured_rates(parse_cbr_quotes(data)).rates
+
+
 class FetchService(AbstractFetchService):
     """
-    Сервис для получения курсов валют с внешнего API.
+    Сервис для получения курсов валют с внешних API.
+
+    Котировки основного источника (ЦБ РФ) и дополнительных поставщиков объединяются в граф;
+    курсы валют, которых нет у основного источника, выводятся по самым дешёвым и свежим цепочкам.
     """
 
     def __init__(self):
         """
         Инициализирует экземпляр класса FetchService.
         """
-        self.client = httpx.AsyncClient()
+        self._client: Optional[httpx.AsyncClient] = None
+        self.derived: Dict[str, List[str]] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        HTTP-клиент, создаваемый при первом получении курсов.
+
+        Создание клиента загружает сертификаты TLS, поэтому не выполняется при запуске сервиса.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def _fetch_provider(self, provider: ProviderConfig) -> List[Quote]:
+        """
+        Получает котировки одного поставщика.
+
+        :param provider: Конфигурация поставщика.
+        :return: Список котировок.
+        """
+        response = await self.client.get(
+            provider.url,
+            timeout=settings.fetch_config.fetch_timeout,
+        )
+        response.raise_for_status()
+        if provider.format == "cbr":
+            return parse_cbr_quotes(response.json(), provider.name, provider.cost)
+        return parse_base_rates_quotes(response.json(), provider.name, provider.cost)
 
     async def fetch_rates(self):
         """
-        Получает курсы валют с внешнего API.
+        Получает котировки всех поставщиков и рассчитывает по ним курсы валют.
+
+        Ошибка отдельного поставщика логируется и не прерывает обновление, если котировки
+        получены хотя бы от одного поставщика.
 
         :return: Словарь с кодами валют и их курсами.
-        :raises Exception: Если произошла ошибка при выполнении запроса или парсинге данных.
-        """
-        try:
-            response = await self.client.get(
-                settings.fetch_config.fetch_url,
-                timeout=settings.fetch_config.fetch_timeout,
-            )
-            response.raise_for_status()
-            data = response.json()
-            parsed = ExchangeRateResponse(**data)
-            rates = dict()
-            for currency in settings.currencies:
-                try:
-                    if currency != "rub":
-                        currency = currency.upper()
-                        rates[currency] = parsed.Valute[currency].Value
-                except KeyError:
-                    logger.exception(
-                        "There is no such currency code in the parsed data."
-                    )
-            rates["RUB"] = Decimal(1.0)
-            return rates
-        except Exception as e:
-            logger.exception("Unknown error when trying to make a httpx request: %s", e)
-            raise
+        :raises ValueError: Если поставщики ответили без ошибок, но ни один не вернул котировки.
+        :raises Exception: Ошибка первого поставщика, если ни один поставщик не вернул котировки.
+        """
+        fetch_config = settings.fetch_config
+        providers = [
+            ProviderConfig(
+                name="cbr",
+                url=fetch_config.fetch_url,
+                format="cbr",
+                cost=fetch_config.fetch_cost,
+            ),
+            *fetch_config.extra_providers,
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_provider(provider) for provider in providers),
+            return_exceptions=True,
+        )
+
+        quotes: List[Quote] = []
+        errors = []
+        for provider, result in zip(providers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Unknown error when trying to fetch rates from %s: %s",
+                    provider.name,
+                    result,
+                )
+                errors.append(result)
+            else:
+                quotes.extend(result)
+        if not quotes:
+            if errors:
+                raise errors[0]
+            raise ValueError("No quotes received from any provider")
+
+        resolved = resolve_configured_rates(quotes)
+        self.derived = resolved.derived
+        return resolved.rates
 
     async def aclose(self):
         """
-        Закрывает HTTP-клиент.
+        Закрывает HTTP-клиент, если он был создан.
         """
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
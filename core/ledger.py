@@ -0,0 +1,274 @@
+import json
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from itertools import groupby
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(settings.logger.logger_name)
+
+INIT = "init"
+SET = "set"
+MODIFY = "modify"
+
+
+class LedgerEntry(NamedTuple):
+    """
+    Запись журнала об одной операции с балансом валюты.
+
+    seq — сквозной номер записи в журнале, он же курсор постраничной выборки. Запись — кортеж,
+    а не dataclass: журнал хранит миллионы записей и выгружает их на диск списками JSON.
+    """
+
+    seq: int
+    timestamp: datetime
+    code: str
+    operation: str
+    delta: Decimal
+    balance: Decimal
+    request_id: Optional[str] = None
+
+
+@dataclass
+class _Segment:
+    """
+    Сегмент журнала фиксированного размера: записи в памяти или путь к файлу, в который они выгружены,
+    и смещения строк записей в этом файле.
+    """
+
+    entries: Optional[List[LedgerEntry]]
+    path: Optional[Path] = None
+    offsets: Optional[array] = None
+
+
+class Ledger:
+    """
+    Журнал операций с балансами валют.
+
+    Записи хранятся в упорядоченных по времени сегментах фиксированного размера; старые заполненные
+    сегменты выгружаются на диск в формате JSON Lines фоновым потоком, а до окончания записи файла
+    остаются в памяти. Время и номера записей каждой валюты хранятся в параллельных отсортированных
+    списках, поэтому начало страницы находится бинарным поиском, а запись по номеру — делением
+    на размер сегмента. Для выгруженного сегмента в памяти остаются смещения строк, и страница
+    читает с диска только свои записи.
+    """
+
+    def __init__(
+        self, segment_size: int, max_memory_segments: int, spill_dir: Path
+    ) -> None:
+        """
+        Инициализирует пустой журнал.
+
+        :param segment_size: Число записей в сегменте.
+        :param max_memory_segments: Сколько последних сегментов держать в памяти.
+        :param spill_dir: Каталог для выгруженных сегментов.
+        """
+        self._segment_size = segment_size
+        self._max_memory_segments = max_memory_segments
+        self._spill_dir = spill_dir
+        self._segments: List[_Segment] = []
+        self._in_memory: List[int] = []
+        self._timestamps: List[float] = []
+        self._index: Dict[str, Tuple[List[float], List[int]]] = {}
+        self._lock = threading.Lock()
+        self._spiller: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def record(
+        self,
+        code: str,
+        operation: str,
+        delta: Decimal,
+        balance: Decimal,
+        timestamp: datetime,
+        request_id: Optional[str] = None,
+    ) -> LedgerEntry:
+        """
+        Добавляет запись об операции в журнал.
+
+        :param code: Код валюты.
+        :param operation: Тип операции (INIT, SET или MODIFY).
+        :param delta: Изменение баланса.
+        :param balance: Баланс после операции.
+        :param timestamp: Время операции (с часовым поясом).
+        :param request_id: Идентификатор запроса, выполнившего операцию.
+        :return: Добавленная запись.
+        """
+        seq = len(self._timestamps)
+        # Время записей не убывает, даже если системные часы перевели назад
+        ts = timestamp.timestamp()
+        if self._timestamps and ts < self._timestamps[-1]:
+            ts = self._timestamps[-1]
+        entry = LedgerEntry(
+            seq=seq,
+            timestamp=timestamp,
+            code=code,
+            operation=operation,
+            delta=delta,
+            balance=balance,
+            request_id=request_id,
+        )
+
+        if seq % self._segment_size == 0:
+            self._segments.append(_Segment(entries=[]))
+            with self._lock:
+                self._in_memory.append(len(self._segments) - 1)
+                while len(self._in_memory) > self._max_memory_segments:
+                    self._schedule_spill(self._in_memory.pop(0))
+        self._segments[-1].entries.append(entry)
+
+        self._timestamps.append(ts)
+        timestamps, seqs = self._index.setdefault(code, ([], []))
+        timestamps.append(ts)
+        seqs.append(seq)
+        return entry
+
+    def _schedule_spill(self, number: int) -> None:
+        """
+        Передаёт заполненный сегмент фоновому потоку для выгрузки на диск.
+
+        :param number: Номер сегмента.
+        """
+        if self._spiller is None:
+            self._spiller = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ledger-spill"
+            )
+        self._spiller.submit(self._spill, number)
+
+    def _spill(self, number: int) -> None:
+        """
+        Выгружает заполненный сегмент на диск и освобождает его записи в памяти.
+
+        Выполняется в фоновом потоке. Если запись не удалась, сегмент возвращается в очередь
+        на выгрузку и будет выгружен повторно при заполнении следующего сегмента.
+
+        :param number: Номер сегмента.
+        """
+        segment = self._segments[number]
+        path = self._spill_dir / f"segment-{number:08d}.jsonl"
+        offsets = array("Q")
+        lines = []
+        position = 0
+        for entry in segment.entries:
+            line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+            offsets.append(position)
+            position += len(line)
+            lines.append(line)
+        try:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                f.writelines(lines)
+        except OSError as e:
+            logger.warning("Failed to spill ledger segment to %s: %s", path, e)
+            with self._lock:
+                self._in_memory.insert(0, number)
+            return
+        # Путь и смещения публикуются раньше, чем освобождаются записи: читатель,
+        # увидевший entries = None, всегда найдёт файл
+        segment.path, segment.offsets = path, offsets
+        segment.entries = None
+
+    def close(self) -> None:
+        """
+        Дожидается окончания выгрузки сегментов, переданных фоновому потоку.
+        """
+        if self._spiller is not None:
+            self._spiller.shutdown(wait=True)
+            self._spiller = None
+
+    @staticmethod
+    def _parse(line: bytes) -> LedgerEntry:
+        """
+        Восстанавливает запись из строки выгруженного сегмента.
+
+        :param line: Строка JSON Lines.
+        :return: Запись журнала.
+        """
+        seq, timestamp, code, operation, delta, balance, request_id = json.loads(line)
+        return LedgerEntry(
+            seq,
+            datetime.fromisoformat(timestamp),
+            code,
+            operation,
+            Decimal(delta),
+            Decimal(balance),
+            request_id,
+        )
+
+    def _segment_entries(
+        self, number: int, positions: Sequence[int]
+    ) -> List[LedgerEntry]:
+        """
+        Получает записи сегмента по их позициям, при необходимости читая с диска только эти записи.
+
+        :param number: Номер сегмента.
+        :param positions: Возрастающие позиции записей в сегменте.
+        :return: Записи в порядке позиций.
+        """
+        segment = self._segments[number]
+        entries = segment.entries
+        if entries is not None:
+            return [entries[i] for i in positions]
+
+        offsets = segment.offsets
+        result = []
+        with open(segment.path, "rb") as f:
+            position = None
+            for i in positions:
+                # Подряд идущие записи читаются без перемещения по файлу
+                if offsets[i] != position:
+                    f.seek(offsets[i])
+                line = f.readline()
+                position = offsets[i] + len(line)
+                result.append(self._parse(line))
+        return result
+
+    def page(
+        self,
+        code: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+    ) -> Tuple[List[LedgerEntry], Optional[int]]:
+        """
+        Возвращает страницу записей журнала в порядке их добавления.
+
+        :param code: Код валюты; по умолчанию — записи всех валют.
+        :param start: Начало интервала времени включительно.
+        :param end: Конец интервала времени включительно.
+        :param cursor: Номер первой записи страницы из предыдущего ответа.
+        :param limit: Максимальное число записей на странице.
+        :return: Записи страницы и курсор следующей страницы или None, если записей больше нет.
+        """
+        if code is None:
+            timestamps = self._timestamps
+            seqs = range(len(timestamps))
+        else:
+            timestamps, seqs = self._index.get(code, ([], []))
+
+        lo = 0 if start is None else bisect_left(timestamps, start.timestamp())
+        if cursor is not None:
+            lo = max(lo, bisect_left(seqs, cursor))
+        hi = len(seqs) if end is None else bisect_right(timestamps, end.timestamp())
+
+        page_end = min(lo + limit, hi)
+        entries = []
+        for number, group in groupby(
+            seqs[lo:page_end], key=lambda seq: seq // self._segment_size
+        ):
+            entries += self._segment_entries(
+                number, [seq % self._segment_size for seq in group]
+            )
+        next_cursor = seqs[page_end] if page_end < hi else None
+        return entries, next_cursor
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from core.ledger import Ledger
+from core.store import BalanceStore
+from schemas.ledger import LedgerPageResponse
+
+
+class LedgerService:
+    """
+    Сервис для постраничного получения журнала операций с балансами валют.
+    """
+
+    def __init__(self, ledger: Ledger, store: BalanceStore) -> None:
+        """
+        Инициализирует экземпляр класса LedgerService.
+
+        :param ledger: Экземпляр Ledger с записями операций.
+        :param store: Экземпляр BalanceStore для проверки кодов валют.
+        """
+        self._ledger = ledger
+        self._store = store
+
+    @staticmethod
+    def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """
+        Приводит время без часового пояса к UTC.
+
+        :param value: Время или None.
+        :return: Время с часовым поясом или None.
+        """
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    def get_page(
+        self,
+        code: Optional[str],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        cursor: Optional[int],
+        limit: int,
+    ) -> LedgerPageResponse:
+        """
+        Получает страницу журнала операций.
+
+        :param code: Код валюты; по умолчанию — операции всех валют.
+        :param start: Начало интервала времени включительно.
+        :param end: Конец интервала времени включительно.
+        :param cursor: Курсор из предыдущего ответа.
+        :param limit: Максимальное число записей на странице.
+        :return: Объект LedgerPageResponse с записями и курсором следующей страницы.
+        :raises HTTPException: Если валюта не поддерживается (код 404).
+        """
+        if code is not None:
+            code = code.upper()
+            if code not in self._store.amounts:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Currency not supported",
+                )
+
+        entries, next_cursor = self._ledger.page(
+            code=code,
+            start=self._as_utc(start),
+            end=self._as_utc(end),
+            cursor=cursor,
+            limit=limit,
+        )
+        return LedgerPageResponse(
+            entries=[entry._asdict() for entry in entries], next_cursor=next_cursor
+        )
@@ -1,11 +1,17 @@
 import logging
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 
+from core.admission import READ, WRITE, AdmissionController
 from core.config import settings
 
 logger = logging.getLogger(settings.logger.logger_name)
 
+# Маршруты (относительно path_prefix), изменяющие данные. Остальные запросы, в том числе
+# POST /convert/, только читают данные и относятся к классу чтения независимо от метода.
+WRITE_ROUTES = ("/amount/set/", "/modify/", "/alerts/")
+
 
 def register_middleware(app: FastAPI) -> None:
     """
@@ -50,3 +56,53 @@ def register_middleware(app: FastAPI) -> None:
             headers=dict(response.headers),
             media_type=response.media_type,
         )
+
+
+def register_admission_middleware(
+    app: FastAPI, controller: AdmissionController
+) -> None:
+    """
+    Регистрирует middleware контроля допуска для запросов к API.
+
+    Запросы к административному API не ограничиваются, чтобы статистика и диагностика
+    оставались доступны во время перегрузки. Класс запроса определяется по маршруту:
+    к записи относятся только изменяющие запросы к WRITE_ROUTES.
+
+    :param app: Экземпляр FastAPI приложения.
+    :param controller: Экземпляр AdmissionController, распределяющий слоты обработки.
+    """
+    prefix = settings.admission_config.path_prefix
+    admin_prefix = f"{prefix}/admin/"
+    retry_after = str(settings.admission_config.retry_after)
+
+    @app.middleware("http")
+    async def admission_control(request: Request, call_next):
+        """
+        Middleware для допуска запросов к обработке или их быстрого отклонения.
+
+        :param request: Входящий HTTP-запрос.
+        :param call_next: Функция для вызова следующего обработчика.
+        :return: HTTP-ответ или ответ 503 с заголовком Retry-After, если запрос отброшен.
+        """
+        path = request.url.path
+        if not path.startswith(prefix) or path.startswith(admin_prefix):
+            return await call_next(request)
+
+        route = path.removeprefix(prefix)
+        kind = (
+            WRITE
+            if request.method not in ("GET", "HEAD") and route.startswith(WRITE_ROUTES)
+            else READ
+        )
+        if not await controller.acquire(kind):
+            logger.debug("Request shed: %s %s", request.method, path)
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Service is overloaded, retry later"},
+                headers={"Retry-After": retry_after},
+            )
+
+        try:
+            return await call_next(request)
+        finally:
+            controller.release(kind)
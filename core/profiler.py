@@ -0,0 +1,266 @@
+import cProfile
+import heapq
+import io
+import itertools
+import pstats
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+
+from core.config import settings
+from core.store import BalanceStore
+
+STORE_METHODS = (
+    "get_amount",
+    "set_amount",
+    "modify_amount",
+    "set_rates",
+    "summary",
+    "totals",
+    "convert",
+)
+
+_store_calls: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "store_calls", default=None
+)
+
+
+class Profiler:
+    """
+    Сеанс cProfile, запускаемый и останавливаемый во время работы приложения.
+
+    Профилируется поток цикла событий, в котором обрабатываются все запросы.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализирует экземпляр класса Profiler.
+        """
+        self._profile: Optional[cProfile.Profile] = None
+
+    @property
+    def running(self) -> bool:
+        return self._profile is not None
+
+    def start(self) -> None:
+        """
+        Запускает сеанс профилирования.
+
+        :raises RuntimeError: Если сеанс уже запущен.
+        """
+        if self._profile is not None:
+            raise RuntimeError("Profiling is already running")
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self, limit: int) -> str:
+        """
+        Останавливает сеанс профилирования и сохраняет результат в файл.
+
+        :param limit: Число функций в текстовом отчёте.
+        :return: Текстовый отчёт, отсортированный по суммарному времени.
+        :raises RuntimeError: Если сеанс не запущен.
+        """
+        if self._profile is None:
+            raise RuntimeError("Profiling is not running")
+        profile, self._profile = self._profile, None
+        profile.disable()
+        profile.dump_stats(settings.profiler_config.dump_file)
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return stream.getvalue()
+
+
+class SlowRequestRecorder:
+    """
+    Регистратор самых медленных запросов.
+
+    Во включённом состоянии оборачивает ASGI-стек приложения, замеряет время вызовов
+    BalanceStore и снимает стек потока цикла событий для запросов, превысивших порог.
+    В выключенном состоянии ничего не оборачивает и не добавляет накладных расходов.
+    """
+
+    def __init__(self, app: FastAPI, store: BalanceStore) -> None:
+        """
+        Инициализирует экземпляр класса SlowRequestRecorder.
+
+        :param app: Экземпляр FastAPI приложения.
+        :param store: Экземпляр BalanceStore, вызовы которого замеряются.
+        """
+        self._app = app
+        self._store = store
+        self._inner = None
+        self._capacity = 0
+        self._threshold = 0.0
+        self._records: List[tuple] = []
+        self._seq = itertools.count()
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampler = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self._inner is not None
+
+    def enable(self, capacity: int, threshold: float) -> None:
+        """
+        Включает регистрацию медленных запросов.
+
+        :param capacity: Сколько самых медленных запросов хранить.
+        :param threshold: Порог длительности запроса в секундах для снятия стека.
+        :raises RuntimeError: Если регистратор уже включён.
+        """
+        if self.enabled:
+            raise RuntimeError("Slow request recorder is already enabled")
+        if self._app.middleware_stack is None:
+            self._app.middleware_stack = self._app.build_middleware_stack()
+
+        self._capacity = capacity
+        self._threshold = threshold
+        self._records = []
+        self._loop_thread_id = threading.get_ident()
+        for name in STORE_METHODS:
+            setattr(self._store, name, self._timed(name, getattr(self._store, name)))
+
+        self._stop_sampler.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_stacks, name="slow-request-sampler", daemon=True
+        )
+        self._sampler.start()
+
+        self._inner = self._app.middleware_stack
+        self._app.middleware_stack = self
+
+    def disable(self) -> None:
+        """
+        Выключает регистрацию медленных запросов и восстанавливает исходный ASGI-стек.
+
+        Записанные запросы остаются доступны до следующего включения.
+
+        :raises RuntimeError: Если регистратор не включён.
+        """
+        if not self.enabled:
+            raise RuntimeError("Slow request recorder is not enabled")
+        self._app.middleware_stack, self._inner = self._inner, None
+        for name in STORE_METHODS:
+            delattr(self._store, name)
+        self._stop_sampler.set()
+        self._sampler.join()
+        self._sampler = None
+
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает записанные медленные запросы.
+
+        :return: Список записей, отсортированный по убыванию длительности.
+        """
+        return [record for _, _, record in sorted(self._records, reverse=True)]
+
+    @staticmethod
+    def _timed(name: str, method):
+        """
+        Оборачивает метод хранилища замером длительности вызова.
+
+        :param name: Имя метода.
+        :param method: Связанный метод хранилища.
+        :return: Обёртка, добавляющая длительность вызова в список вызовов текущего запроса.
+        """
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            calls = _store_calls.get()
+            if calls is None:
+                return method(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                calls.append({"name": name, "duration": time.perf_counter() - started})
+
+        return wrapper
+
+    def _sample_stacks(self) -> None:
+        """
+        Снимает стек потока цикла событий для запросов, превысивших порог и ещё не имеющих снимка.
+
+        Выполняется в отдельном потоке, поэтому стек снимается и тогда, когда цикл событий
+        заблокирован синхронной работой.
+        """
+        interval = settings.profiler_config.sample_interval
+        while not self._stop_sampler.wait(interval):
+            now = time.perf_counter()
+            for request in list(self._in_flight.values()):
+                if (
+                    request["stack"] is None
+                    and now - request["start"] >= self._threshold
+                ):
+                    frame = sys._current_frames().get(self._loop_thread_id)
+                    if frame is not None:
+                        request["stack"] = "".join(traceback.format_stack(frame))
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self._inner(scope, receive, send)
+            return
+
+        seq = next(self._seq)
+        calls: List[Dict[str, Any]] = []
+        request = {"start": time.perf_counter(), "stack": None, "status": None}
+        self._in_flight[seq] = request
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                request["status"] = message["status"]
+            await send(message)
+
+        token = _store_calls.set(calls)
+        try:
+            await self._inner(scope, receive, send_wrapper)
+        finally:
+            _store_calls.reset(token)
+            del self._in_flight[seq]
+            self._record(scope, request, calls)
+
+    def _record(
+        self, scope, request: Dict[str, Any], calls: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Сохраняет запрос, если он входит в число самых медленных.
+
+        :param scope: ASGI scope запроса.
+        :param request: Состояние запроса: время начала, статус и снимок стека.
+        :param calls: Замеры вызовов хранилища за время запроса.
+        """
+        duration = time.perf_counter() - request["start"]
+        if len(self._records) >= self._capacity and duration <= self._records[0][0]:
+            return
+
+        route = scope.get("route")
+        fetch_task = getattr(self._app.state, "_fetch_task", None)
+        record = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", None),
+            "status": request["status"],
+            "duration": duration,
+            "finished_at": datetime.now(timezone.utc),
+            "store_calls": calls,
+            "fetch_state": {
+                "rates_updated_at": self._store.rates_updated_at,
+                "fetch_task_running": fetch_task is not None and not fetch_task.done(),
+            },
+            "stack": request["stack"],
+        }
+        heapq.heappush(self._records, (duration, next(self._seq), record))
+        if len(self._records) > self._capacity:
+            heapq.heappop(self._records)
@@ -0,0 +1,116 @@
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ANCHOR = "RUB"
+
+
+@dataclass(frozen=True)
+class Quote:
+    """
+    Котировка поставщика: 1 единица base стоит rate единиц quote.
+    """
+
+    base: str
+    quote: str
+    rate: Decimal
+    provider: str
+    cost: float
+    published_at: Optional[datetime] = None
+
+
+@dataclass
+class ResolvedRates:
+    """
+    Курсы валют к опорной валюте, рассчитанные по графу котировок.
+
+    paths содержит для каждой валюты цепочку кодов от неё до опорной валюты; курс считается
+    производным, если цепочка длиннее одной котировки.
+    """
+
+    rates: Dict[str, Decimal] = field(default_factory=dict)
+    paths: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def derived(self) -> Dict[str, List[str]]:
+        return {code: path for code, path in self.paths.items() if len(path) > 2}
+
+
+def _edge_weight(quote: Quote, now: datetime, staleness_penalty: float) -> float:
+    """
+    Рассчитывает стоимость ребра графа: стоимость поставщика плюс штраф за возраст котировки.
+
+    :param quote: Котировка.
+    :param now: Текущее время.
+    :param staleness_penalty: Штраф за каждый час возраста котировки.
+    :return: Стоимость ребра.
+    """
+    if quote.published_at is None:
+        return quote.cost
+    age_hours = max((now - quote.published_at).total_seconds(), 0) / 3600
+    return quote.cost + staleness_penalty * age_hours
+
+
+def resolve_rates(
+    quotes: Iterable[Quote],
+    currencies: Iterable[str],
+    now: datetime,
+    staleness_penalty: float,
+    anchor: str = ANCHOR,
+) -> ResolvedRates:
+    """
+    Рассчитывает курсы валют к опорной валюте по самым дешёвым и свежим цепочкам котировок.
+
+    Котировки всех поставщиков образуют взвешенный граф валют; из нескольких котировок одной пары
+    остаётся самая дешёвая. Кратчайшие пути от опорной валюты находятся алгоритмом Дейкстры
+    один раз на обновление курсов.
+
+    :param quotes: Котировки всех поставщиков.
+    :param currencies: Коды валют, для которых нужны курсы.
+    :param now: Текущее время для расчёта возраста котировок.
+    :param staleness_penalty: Штраф за каждый час возраста котировки.
+    :param anchor: Опорная валюта, к которой приводятся курсы.
+    :return: Курсы и цепочки котировок для достижимых валют.
+    """
+    # graph[u][v] = (вес, множитель): стоимость 1 единицы v в единицах u
+    graph: Dict[str, Dict[str, Tuple[float, Decimal]]] = {}
+    for quote in quotes:
+        weight = _edge_weight(quote, now, staleness_penalty)
+        for u, v, multiplier in (
+            (quote.quote, quote.base, quote.rate),
+            (quote.base, quote.quote, 1 / quote.rate),
+        ):
+            edges = graph.setdefault(u, {})
+            if v not in edges or weight < edges[v][0]:
+                edges[v] = (weight, multiplier)
+
+    rates: Dict[str, Decimal] = {anchor: Decimal(1)}
+    previous: Dict[str, str] = {}
+    distances: Dict[str, float] = {anchor: 0.0}
+    counter = itertools.count()
+    heap: List[Tuple[float, int, str]] = [(0.0, next(counter), anchor)]
+    while heap:
+        distance, _, u = heapq.heappop(heap)
+        if distance > distances[u]:
+            continue
+        for v, (weight, multiplier) in graph.get(u, {}).items():
+            candidate = distance + weight
+            if candidate < distances.get(v, float("inf")):
+                distances[v] = candidate
+                rates[v] = rates[u] * multiplier
+                previous[v] = u
+                heapq.heappush(heap, (candidate, next(counter), v))
+
+    resolved = ResolvedRates()
+    for code in currencies:
+        if code not in rates:
+            continue
+        path = [code]
+        while path[-1] != anchor:
+            path.append(previous[path[-1]])
+        resolved.rates[code] = rates[code]
+        resolved.paths[code] = path
+    return resolved
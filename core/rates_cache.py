@@ -0,0 +1,64 @@
+import json
+import logging
+import os
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(settings.logger.logger_name)
+
+CachedRates = Tuple[Dict[str, Decimal], datetime, Dict[str, List[str]]]
+
+
+def save_rates_cache(
+    rates: Mapping[str, Decimal],
+    updated_at: datetime,
+    derived: Optional[Mapping[str, Sequence[str]]] = None,
+) -> None:
+    """
+    Сохраняет последний успешно полученный набор курсов в локальный файл.
+
+    Запись выполняется через временный файл и атомарную замену, чтобы при сбое
+    на диске не остался частично записанный кеш.
+
+    :param rates: Словарь с кодами валют и их курсами.
+    :param updated_at: Время получения курсов.
+    :param derived: Цепочки котировок для курсов, выведенных через другие валюты.
+    """
+    path = settings.cache_config.rates_file
+    tmp_path = path.with_name(path.name + ".tmp")
+    data = {
+        "updated_at": updated_at.isoformat(),
+        "rates": {code: str(rate) for code, rate in rates.items()},
+        "derived": {code: list(chain) for code, chain in (derived or {}).items()},
+    }
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to save rates cache %s: %s", path, e)
+
+
+def load_rates_cache() -> Optional[CachedRates]:
+    """
+    Загружает последний сохранённый набор курсов из локального файла.
+
+    :return: Кортеж (курсы, время получения, производные курсы) или None, если кеш отсутствует
+        или повреждён.
+    """
+    path = settings.cache_config.rates_file
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        rates = {code: Decimal(rate) for code, rate in data["rates"].items()}
+        updated_at = datetime.fromisoformat(data["updated_at"])
+        derived = data.get("derived", {})
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Failed to load rates cache %s: %s", path, e)
+        return None
+    return rates, updated_at, derived
@@ -0,0 +1,112 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Dict, Iterator, Optional, TextIO, Tuple
+
+from core.fetch_service import parse_rates
+from core.store import BalanceStore
+from utils.abstracts import AbstractFetchService
+
+
+def iter_snapshots(source: Path) -> Iterator[Tuple[str, Dict[str, Decimal]]]:
+    """
+    Потоково читает записанную историю курсов.
+
+    Поддерживаются каталог со снимками daily_json.js (обрабатываются в порядке имён файлов)
+    и CSV-файл с колонкой date и колонками курсов к рублю для каждой валюты. Пустая ячейка CSV
+    означает, что курса валюты на этом шаге нет, как и при отсутствии колонки.
+
+    :param source: Путь к каталогу со снимками или к CSV-файлу.
+    :return: Итератор пар (метка шага, курсы валют).
+    :raises ValueError: Если ячейка CSV содержит не число.
+    """
+    if source.is_dir():
+        for path in sorted(p for p in source.iterdir() if p.is_file()):
+            with open(path, encoding="utf-8") as f:
+                yield path.name, parse_rates(json.load(f))
+        return
+
+    with open(source, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            step = row.pop("date")
+            rates = {}
+            for code, value in row.items():
+                if value is None or not value.strip():
+                    continue
+                try:
+                    rates[code.upper()] = Decimal(value)
+                except InvalidOperation:
+                    raise ValueError(
+                        f"{source}, line {reader.line_num} ({step}): invalid {code} rate {value!r}"
+                    ) from None
+            rates.setdefault("RUB", Decimal(1))
+            yield step, rates
+
+
+class ReplayFetchService(AbstractFetchService):
+    """
+    Сервис получения курсов, выдающий записанную историю курсов вместо запросов к внешнему API.
+    """
+
+    def __init__(self, source: Path) -> None:
+        """
+        Инициализирует экземпляр класса ReplayFetchService.
+
+        :param source: Путь к каталогу со снимками daily_json.js или к CSV-файлу.
+        """
+        self._snapshots = iter_snapshots(source)
+        self.step: Optional[str] = None
+
+    async def fetch_rates(self):
+        """
+        Возвращает курсы следующего шага истории.
+
+        :return: Словарь с кодами валют и их курсами.
+        :raises StopAsyncIteration: Если история закончилась.
+        """
+        try:
+            self.step, rates = next(self._snapshots)
+        except StopIteration:
+            raise StopAsyncIteration
+        return rates
+
+    async def aclose(self):
+        """
+        Закрывает источник истории курсов.
+        """
+        self._snapshots.close()
+
+
+async def run_replay(
+    store: BalanceStore, fetch_service: AbstractFetchService, output: TextIO
+) -> Tuple[int, int]:
+    """
+    Прогоняет историю курсов через хранилище без пауз и HTTP и записывает итоговые суммы по шагам.
+
+    :param store: Экземпляр BalanceStore с начальными количествами валют.
+    :param fetch_service: Сервис получения курсов, выдающий историю по шагам.
+    :param output: Поток для записи итоговых сумм в формате CSV.
+    :return: Кортеж (число обработанных шагов, число пропущенных шагов без курса какой-либо валюты).
+    """
+    codes = list(store.amounts)
+    writer = csv.writer(output)
+    writer.writerow(["step", *(f"total_{code.lower()}" for code in codes)])
+
+    steps = skipped = 0
+    while True:
+        try:
+            rates = await fetch_service.fetch_rates()
+        except StopAsyncIteration:
+            break
+        store.set_rates(rates=rates)
+        try:
+            totals = store.totals()
+            row = [round(totals[code], 4) for code in codes]
+        except KeyError:
+            skipped += 1
+            continue
+        writer.writerow([fetch_service.step, *row])
+        steps += 1
+    return steps, skipped
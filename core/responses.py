@@ -0,0 +1,57 @@
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson устанавливается только для профиля --perf
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """
+    Сериализует типы, которые orjson не поддерживает напрямую.
+
+    Decimal выводится строкой, как и в стандартном ответе FastAPI, чтобы не терять точность.
+
+    :param obj: Объект для сериализации.
+    :return: Представление объекта, поддерживаемое orjson.
+    :raises TypeError: Если тип не поддерживается.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class DecimalORJSONResponse(JSONResponse):
+    """
+    JSON-ответ, сериализуемый orjson, с поддержкой Decimal и pydantic-моделей.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+def hot_response(request: Request, content: Any) -> Any:
+    """
+    Возвращает ответ горячего маршрута на чтение.
+
+    В профиле --perf содержимое сразу сериализуется orjson, минуя повторную валидацию
+    response_model; в обычном режиме возвращается как есть для стандартной обработки FastAPI.
+
+    :param request: Входящий HTTP-запрос.
+    :param content: Содержимое ответа.
+    :return: Готовый ответ DecimalORJSONResponse или исходное содержимое.
+    """
+    if request.app.state.perf:
+        return DecimalORJSONResponse(content)
+    return content
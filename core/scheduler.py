@@ -1,7 +1,9 @@
 import asyncio
 import logging
+from datetime import datetime, timezone
 
 from core.config import settings
+from core.rates_cache import save_rates_cache
 from core.store import BalanceStore
 from utils.abstracts import AbstractFetchService
 
@@ -16,15 +18,38 @@ async def scheduler_fetch(
     """
     Периодически получает курсы валют и обновляет их в хранилище.
 
+    Каждый успешно полученный набор курсов сохраняется в локальный кеш. При ошибке получения
+    в хранилище остаются последние известные курсы, а попытка повторяется через период.
+    Если при запуске в хранилище уже есть курсы из кеша, первое получение откладывается
+    до истечения периода с момента их получения.
+
     :param store: Экземпляр BalanceStore для хранения данных о валютах.
     :param fetch_service: Сервис для получения курсов валют.
     :param period: Период обновления в минутах.
     """
     try:
+        if store.rates_updated_at is not None:
+            age = datetime.now(timezone.utc) - store.rates_updated_at
+            await asyncio.sleep(max(period * 60 - age.total_seconds(), 0))
         while True:
-            data = await fetch_service.fetch_rates()
-            store.set_rates(rates=data)
-            logger.info("Fetched rates: %s", data)
+            try:
+                data = await fetch_service.fetch_rates()
+            except Exception as e:
+                logger.warning("Failed to fetch rates, keeping last known rates: %r", e)
+            else:
+                # Ошибка обработки полученных курсов не должна останавливать периодическое получение
+                try:
+                    store.set_rates(rates=data, derived=fetch_service.derived)
+                    snapshot = store.snapshot()
+                    save_rates_cache(
+                        rates=snapshot.rates,
+                        updated_at=snapshot.rates_updated_at,
+                        derived=snapshot.derived,
+                    )
+                except Exception:
+                    logger.exception("Failed to apply fetched rates")
+                else:
+                    logger.info("Fetched rates: %s", data)
             await asyncio.sleep(period * 60)
     except asyncio.CancelledError:
         return
@@ -32,14 +57,41 @@ async def scheduler_fetch(
 
 async def scheduler_print(store: BalanceStore):
     """
-    Периодически выводит в лог сводную информацию о валютах.
+    Периодически выводит в лог изменения сводной информации о валютах.
+
+    Если данные хранилища не менялись с прошлого вывода, ничего не выводится; иначе выводятся
+    только изменившиеся количества, курсы и суммы. Раз в full_dump_interval минут выводится
+    полная сводка.
 
     :param store: Экземпляр BalanceStore для хранения данных о валютах.
     """
+    config = settings.scheduler_config
+    loop = asyncio.get_running_loop()
+    last_version = None
+    last_summary = None
+    last_full_dump = loop.time()
     try:
         while True:
-            await asyncio.sleep(settings.scheduler_config.print_sleep * 60)
-            logg_data = store.format_console()
-            logger.info(logg_data)
+            await asyncio.sleep(config.print_sleep * 60)
+            snapshot = store.snapshot()
+            if not snapshot.rates:
+                continue
+
+            full_dump_due = (
+                loop.time() - last_full_dump >= config.full_dump_interval * 60
+            )
+            if snapshot.version == last_version and not full_dump_due:
+                continue
+
+            summary_data = store.summary(snapshot)
+            if last_summary is None or full_dump_due:
+                logger.info(store.format_console(summary_data))
+                last_full_dump = loop.time()
+            else:
+                logg_data = store.format_diff(last_summary, summary_data)
+                if logg_data:
+                    logger.info(logg_data)
+            last_version = snapshot.version
+            last_summary = summary_data
     except asyncio.CancelledError:
         return
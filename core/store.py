@@ -1,36 +1,121 @@
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 import logging
+import threading
 
 from core.config import settings
+from core.ledger import INIT, MODIFY, SET, Ledger
 
 logger = logging.getLogger(settings.logger.logger_name)
 
-# TODO: можно добавить кеширование
+_EMPTY: Mapping = MappingProxyType({})
+
+
+class StoreSnapshot(NamedTuple):
+    """
+    Неизменяемое состояние хранилища одной версии: количества, курсы и кросс-курсы.
+
+    Словари обёрнуты в MappingProxyType и не изменяются после публикации снимка; следующая версия
+    создаётся заменой изменившихся частей, неизменившиеся части переиспользуются. Снимок — кортеж,
+    а не dataclass: он создаётся при каждой записи, и создание кортежа дешевле.
+    """
+
+    version: int = 0
+    amounts: Mapping[str, Decimal] = _EMPTY
+    rates: Mapping[str, Decimal] = _EMPTY
+    cross_rates: Mapping[Tuple[str, str], Decimal] = _EMPTY
+    rates_updated_at: Optional[datetime] = None
+    derived: Mapping[str, Tuple[str, ...]] = _EMPTY
 
 
 class BalanceStore:
     """
     Класс для хранения и управления данными о валютах, включая их количества и курсы обмена.
+
+    Состояние публикуется неизменяемыми снимками StoreSnapshot: запись собирает следующую версию
+    и подменяет ссылку на текущий снимок одним присваиванием. Чтение берёт снимок один раз
+    и работает только с ним, поэтому не видит частично применённых изменений и не требует блокировок.
+    Записи сериализуются блокировкой.
     """
 
-    def __init__(self):
+    def __init__(self, ledger: Optional[Ledger] = None):
         """
         Инициализирует экземпляр класса BalanceStore.
+
+        :param ledger: Журнал, в который записываются операции с балансами; по умолчанию операции не записываются.
         """
-        self.amounts: Dict[str, Decimal] = {}
-        self.rates: Dict[str, Decimal] = {}
+        self.ledger = ledger
+        self._snapshot = StoreSnapshot()
+        self._write_lock = threading.Lock()
         self._changed = False
+        self._listeners: List[Callable[["BalanceStore", bool], None]] = []
+        self._summary_cache: Tuple[
+            Optional[StoreSnapshot], Optional[Dict[str, Any]]
+        ] = (
+            None,
+            None,
+        )
+        self._logged_summary: Optional[Dict[str, Any]] = None
+
+    def snapshot(self) -> StoreSnapshot:
+        """
+        Возвращает текущий снимок состояния хранилища.
 
-    def _check_amount(self, code, new_amount):
+        :return: Неизменяемый снимок; последующие записи его не затрагивают.
+        """
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def amounts(self) -> Mapping[str, Decimal]:
+        return self._snapshot.amounts
+
+    @property
+    def rates(self) -> Mapping[str, Decimal]:
+        return self._snapshot.rates
+
+    @property
+    def rates_updated_at(self) -> Optional[datetime]:
+        return self._snapshot.rates_updated_at
+
+    @property
+    def derived(self) -> Mapping[str, Tuple[str, ...]]:
+        return self._snapshot.derived
+
+    def _publish_amounts(self, amounts: Dict[str, Decimal]) -> None:
+        """
+        Публикует следующую версию состояния с новыми количествами валют.
+
+        Вызывается под блокировкой записи. Курсы и кросс-курсы переиспользуются из текущего снимка.
+
+        :param amounts: Новые количества валют; после вызова словарь не должен изменяться.
+        """
+        current = self._snapshot
+        self._snapshot = StoreSnapshot(
+            current.version + 1,
+            MappingProxyType(amounts),
+            current.rates,
+            current.cross_rates,
+            current.rates_updated_at,
+            current.derived,
+        )
+
+    @staticmethod
+    def _check_amount(amounts: Mapping[str, Decimal], code, new_amount):
         """
         Проверяет, не станет ли количество валюты отрицательным после изменения.
 
+        :param amounts: Количества валют, к которым применяется изменение.
         :param code: Код валюты.
         :param new_amount: Величина изменения количества.
         :raises ValueError: Если количество станет отрицательным.
         """
-        if self.amounts[code] + new_amount < 0:
+        if amounts[code] + new_amount < 0:
             raise ValueError("The amount of currency cannot be less than zero", code)
 
     def set_changed(self) -> None:
@@ -42,27 +127,126 @@ class BalanceStore:
     def log_changed(self) -> None:
         """
         Логирует изменения данных, если они произошли.
+
+        Первый раз выводится полная сводка, далее — только изменившиеся количества, курсы и суммы.
         """
         if self._changed:
-            console = self.format_console()
-            logger.info("Currency changed: %s", console)
+            snapshot = self._snapshot
+            if logger.isEnabledFor(logging.INFO) and snapshot.rates:
+                summary_data = self.summary(snapshot)
+                if self._logged_summary is None:
+                    console = self.format_console(summary_data)
+                else:
+                    console = self.format_diff(self._logged_summary, summary_data)
+                if console:
+                    logger.info("Currency changed: %s", console)
+                self._logged_summary = summary_data
             self._changed = False
 
-    def data_change(self) -> None:
+    def add_listener(self, listener: Callable[["BalanceStore", bool], None]) -> None:
         """
-        Отмечает, что данные были изменены, и логирует это.
+        Подписывает обработчик на изменения данных хранилища.
+
+        :param listener: Функция, принимающая хранилище и флаг изменения курсов.
+        """
+        self._listeners.append(listener)
+
+    def data_change(self, rates_changed: bool = False) -> None:
+        """
+        Отмечает, что данные были изменены, логирует это и уведомляет подписчиков.
+
+        :param rates_changed: True, если изменились курсы; False, если изменились только количества.
         """
         self.set_changed()
         self.log_changed()
+        for listener in self._listeners:
+            listener(self, rates_changed)
 
-    def set_rates(self, rates: Dict[str, Decimal]) -> None:
+    def set_rates(
+        self,
+        rates: Dict[str, Decimal],
+        updated_at: Optional[datetime] = None,
+        derived: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
         """
         Устанавливает курсы обмена для валют.
 
+        Курсы копируются: последующие изменения переданного словаря не влияют на хранилище.
+        Количества валют переиспользуются из текущего снимка.
+
         :param rates: Словарь с кодами валют и их курсами.
+        :param updated_at: Время получения курсов; по умолчанию — текущее время.
+        :param derived: Цепочки котировок для курсов, выведенных через другие валюты.
         """
-        self.rates = rates
-        self.data_change()
+        rates = dict(rates)
+        cross_rates = self._build_cross_rates(rates)
+        derived = {code: tuple(path) for code, path in (derived or {}).items()}
+        with self._write_lock:
+            current = self._snapshot
+            self._snapshot = StoreSnapshot(
+                current.version + 1,
+                current.amounts,
+                MappingProxyType(rates),
+                MappingProxyType(cross_rates),
+                updated_at or datetime.now(timezone.utc),
+                MappingProxyType(derived),
+            )
+        self.data_change(rates_changed=True)
+
+    @staticmethod
+    def _build_cross_rates(
+        rates: Mapping[str, Decimal],
+    ) -> Dict[Tuple[str, str], Decimal]:
+        """
+        Предрассчитывает таблицу кросс-курсов для всех пар валют.
+
+        Ключ таблицы — пара (из какой валюты, в какую), значение — множитель для конвертации.
+
+        :param rates: Курсы валют.
+        :return: Таблица кросс-курсов.
+        """
+        return {(c1, c2): rates[c1] / rates[c2] for c1 in rates for c2 in rates}
+
+    def get_cross_rate(self, src: str, dst: str) -> Optional[Decimal]:
+        """
+        Получает кросс-курс для пары валют из предрассчитанной таблицы.
+
+        :param src: Код исходной валюты.
+        :param dst: Код целевой валюты.
+        :return: Множитель для конвертации или None, если курса нет.
+        """
+        return self._snapshot.cross_rates.get((src, dst))
+
+    def _record(
+        self,
+        code: str,
+        operation: str,
+        delta: Decimal,
+        balance: Decimal,
+        timestamp: datetime,
+        request_id: Optional[str],
+    ) -> None:
+        """
+        Записывает операцию с балансом валюты в журнал, если он подключён.
+
+        Вызывается под блокировкой записи.
+
+        :param code: Код валюты.
+        :param operation: Тип операции.
+        :param delta: Изменение баланса.
+        :param balance: Баланс после операции.
+        :param timestamp: Время операции.
+        :param request_id: Идентификатор запроса, выполнившего операцию.
+        """
+        if self.ledger is not None:
+            self.ledger.record(
+                code=code,
+                operation=operation,
+                delta=delta,
+                balance=balance,
+                timestamp=timestamp,
+                request_id=request_id,
+            )
 
     def init_amount(self, amounts: Dict[str, Decimal]) -> None:
         """
@@ -70,7 +254,12 @@ class BalanceStore:
 
         :param amounts: Словарь с кодами валют и их начальными количествами.
         """
-        self.amounts = {cur.upper(): amount for cur, amount in amounts.items()}
+        amounts = {cur.upper(): amount for cur, amount in amounts.items()}
+        now = datetime.now(timezone.utc)
+        with self._write_lock:
+            self._publish_amounts(amounts)
+            for code, amount in amounts.items():
+                self._record(code, INIT, amount, amount, now, None)
 
     def get_amount(self, currency_code: str) -> Decimal:
         """
@@ -79,63 +268,151 @@ class BalanceStore:
         :param currency_code: Код валюты.
         :return: Количество валюты в виде Decimal.
         """
-        return self.amounts.get(currency_code)
+        return self._snapshot.amounts.get(currency_code)
 
-    def set_amount(self, new_amounts: Dict[str, Decimal]) -> None:
+    def set_amount(
+        self, new_amounts: Dict[str, Decimal], request_id: Optional[str] = None
+    ) -> None:
         """
         Устанавливает новые количества для указанных валют.
 
         :param new_amounts: Словарь с кодами валют и их новыми количествами.
+        :param request_id: Идентификатор запроса для записи в журнал операций.
         """
-        for code, amount in new_amounts.items():
-            self.amounts[code.upper()] = amount
+        now = datetime.now(timezone.utc)
+        with self._write_lock:
+            previous = self._snapshot.amounts
+            amounts = dict(previous)
+            for code, amount in new_amounts.items():
+                amounts[code.upper()] = amount
+            self._publish_amounts(amounts)
+            for code, amount in new_amounts.items():
+                code = code.upper()
+                delta = amount - previous.get(code, 0)
+                self._record(code, SET, delta, amount, now, request_id)
         self.data_change()
 
-    def modify_amount(self, modify_amounts: Dict[str, Decimal]) -> None:
+    def modify_amount(
+        self, modify_amounts: Dict[str, Decimal], request_id: Optional[str] = None
+    ) -> None:
         """
         Изменяет количества указанных валют на заданные величины.
 
+        Изменения применяются все вместе: если хотя бы одно количество станет отрицательным,
+        не применяется ни одно.
+
         :param modify_amounts: Словарь с кодами валют и величинами изменения их количества.
+        :param request_id: Идентификатор запроса для записи в журнал операций.
         """
-        for code, amount in modify_amounts.items():
-            code = code.upper()
-            self._check_amount(code, amount)
-            self.amounts[code] = self.amounts.get(code, 0) + amount
+        now = datetime.now(timezone.utc)
+        with self._write_lock:
+            amounts = dict(self._snapshot.amounts)
+            for code, amount in modify_amounts.items():
+                code = code.upper()
+                self._check_amount(amounts, code, amount)
+                amounts[code] = amounts.get(code, 0) + amount
+            self._publish_amounts(amounts)
+            for code, amount in modify_amounts.items():
+                code = code.upper()
+                self._record(code, MODIFY, amount, amounts[code], now, request_id)
         self.data_change()
 
-    def summary(self) -> Dict[str, Dict[str, Decimal]]:
+    def unresolved(self, snapshot: Optional[StoreSnapshot] = None) -> List[str]:
+        """
+        Возвращает валюты, для которых есть количество, но нет курса.
+
+        :param snapshot: Снимок состояния; по умолчанию — текущий.
+        :return: Коды валют без курса в порядке количеств.
+        """
+        if snapshot is None:
+            snapshot = self._snapshot
+        rates = snapshot.rates
+        return [code for code in snapshot.amounts if code not in rates]
+
+    def summary(
+        self, snapshot: Optional[StoreSnapshot] = None
+    ) -> Dict[str, Dict[str, Decimal]]:
         """
         Возвращает сводную информацию о валютах, включая их количества, курсы обмена и общие суммы в базовых валютах.
 
-        :return: Словарь с ключами "amounts", "rates" и "total".
+        Все части сводки рассчитываются по одному снимку. Курсы пар и общие суммы строятся только
+        по валютам с известным курсом; остальные перечисляются в "unresolved". Сводка кешируется
+        до публикации следующего снимка; возвращаемый словарь не должен изменяться вызывающим кодом.
+
+        :param snapshot: Снимок состояния; по умолчанию — текущий.
+        :return: Словарь с ключами "amounts", "rates", "total", "unresolved", "rates_updated_at" и "derived".
         """
-        summary = {"amounts": dict(self.amounts)}
+        if snapshot is None:
+            snapshot = self._snapshot
+        cached_snapshot, cached_summary = self._summary_cache
+        if cached_snapshot is snapshot:
+            return cached_summary
+
+        amounts = snapshot.amounts
+        cross_rates = snapshot.cross_rates
+        priced = [code for code in amounts if code in snapshot.rates]
+        summary = {"amounts": dict(amounts)}
         pair_rates = {
-            f"{c2}-{c1}": round(self.rates[c2] / self.rates[c1], 4)
-            for c1 in self.amounts
-            for c2 in self.amounts
+            f"{c2}-{c1}": round(cross_rates[(c2, c1)], 4)
+            for c1 in priced
+            for c2 in priced
             if c1 != c2
         }
         result_rates = {pair: pair_rates[pair] for pair in sorted(pair_rates)}
 
-        totals: Dict[str, float] = {}
-        for base in self.rates:
-            total = sum(
-                self.amounts[c] * self.rates[c] / self.rates[base] for c in self.amounts
-            )
-            totals[base] = round(total, 4)
+        totals = {
+            base: round(total, 4) for base, total in self.totals(snapshot).items()
+        }
 
         summary["rates"] = result_rates
         summary["total"] = totals
+        summary["unresolved"] = self.unresolved(snapshot)
+        summary["rates_updated_at"] = snapshot.rates_updated_at
+        summary["derived"] = {
+            code: list(path) for code, path in snapshot.derived.items()
+        }
+
+        self._summary_cache = (snapshot, summary)
         return summary
 
-    def format_console(self) -> str:
+    def totals(self, snapshot: Optional[StoreSnapshot] = None) -> Dict[str, Decimal]:
+        """
+        Рассчитывает общую сумму средств в каждой из валют с известным курсом.
+
+        Сумма считается один раз в единицах курсов и затем делится на курс каждой валюты.
+        Валюты без курса (см. unresolved) в сумму не входят.
+
+        :param snapshot: Снимок состояния; по умолчанию — текущий.
+        :return: Словарь с кодами валют и общей суммой средств в них без округления.
+        """
+        if snapshot is None:
+            snapshot = self._snapshot
+        amounts, rates = snapshot.amounts, snapshot.rates
+        total = sum(amounts[c] * rates[c] for c in amounts if c in rates)
+        return {base: total / rate for base, rate in rates.items()}
+
+    def convert(self, items: List[Tuple[str, str, Decimal]]) -> List[Decimal]:
+        """
+        Конвертирует набор сумм по предрассчитанной таблице кросс-курсов.
+
+        :param items: Список кортежей (код исходной валюты, код целевой валюты, сумма).
+        :return: Список сконвертированных сумм в порядке входных данных.
+        :raises KeyError: Если для пары валют нет курса; аргумент исключения — пара (из, в).
+        """
+        cross_rates = self._snapshot.cross_rates
+        return [
+            round(amount * cross_rates[(src, dst)], 4) for src, dst, amount in items
+        ]
+
+    def format_console(self, summary_data: Optional[Dict[str, Any]] = None) -> str:
         """
         Форматирует сводную информацию для вывода в консоль.
 
+        :param summary_data: Готовая сводка; по умолчанию берётся текущая (кешированная) сводка.
         :return: Строковое представление сводной информации.
         """
-        summary_data = self.summary()
+        if summary_data is None:
+            summary_data = self.summary()
 
         lines: list[str] = []
         for cur, amount in summary_data["amounts"].items():
@@ -147,7 +424,50 @@ class BalanceStore:
         lines.append("")
 
         total = summary_data["total"]
-        parts = [f"{total[cur]:.4f} {cur.lower()}" for cur in summary_data["amounts"]]
+        parts = [
+            f"{total[cur]:.4f} {cur.lower()}"
+            for cur in summary_data["amounts"]
+            if cur in total
+        ]
         lines.append("sum: " + " / ".join(parts))
+        unresolved = summary_data["unresolved"]
+        if unresolved:
+            lines.append("no rate: " + ", ".join(cur.lower() for cur in unresolved))
 
         return "\n".join(lines)
+
+    @staticmethod
+    def format_diff(previous: Dict[str, Any], current: Dict[str, Any]) -> str:
+        """
+        Форматирует для вывода в консоль только то, что изменилось между двумя сводками.
+
+        :param previous: Предыдущая сводка.
+        :param current: Текущая сводка.
+        :return: Строка с изменившимися количествами, курсами, суммами и валютами без курса или пустая строка.
+        """
+        sections: list[list[str]] = [
+            [
+                f"{cur.lower()}: {amount}"
+                for cur, amount in current["amounts"].items()
+                if previous["amounts"].get(cur) != amount
+            ],
+            [
+                f"{pair.lower()}: {val}"
+                for pair, val in current["rates"].items()
+                if previous["rates"].get(pair) != val
+            ],
+        ]
+
+        total, previous_total = current["total"], previous["total"]
+        parts = [
+            f"{total[cur]:.4f} {cur.lower()}"
+            for cur in current["amounts"]
+            if cur in total and previous_total.get(cur) != total[cur]
+        ]
+        if parts:
+            sections.append(["sum: " + " / ".join(parts)])
+        if current["unresolved"] != previous["unresolved"]:
+            unresolved = ", ".join(cur.lower() for cur in current["unresolved"])
+            sections.append([f"no rate: {unresolved or '-'}"])
+
+        return "\n\n".join("\n".join(lines) for lines in sections if lines)
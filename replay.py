@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import sys
+import time
+from contextlib import nullcontext
+from decimal import Decimal
+
+from core.config import settings
+from core.replay import ReplayFetchService, run_replay
+from core.store import BalanceStore
+from utils.cli import parse_replay_args
+
+logger = logging.getLogger(settings.logger.logger_name)
+
+
+async def replay(args) -> None:
+    """
+    Воспроизводит записанную историю курсов через BalanceStore и выводит итоговые суммы по шагам.
+
+    Args:
+        args: Разобранные аргументы командной строки.
+    """
+    store = BalanceStore()
+    store.init_amount(
+        amounts={
+            currency.upper(): Decimal(getattr(args, currency))
+            for currency in settings.currencies
+        }
+    )
+    fetch = ReplayFetchService(source=args.source)
+
+    output = (
+        open(args.output, "w", encoding="utf-8", newline="")
+        if args.output
+        else nullcontext(sys.stdout)
+    )
+    started = time.perf_counter()
+    with output as f:
+        steps, skipped = await run_replay(store=store, fetch_service=fetch, output=f)
+    elapsed = time.perf_counter() - started
+    await fetch.aclose()
+
+    print(
+        f"Replayed {steps} steps ({skipped} skipped) in {elapsed:.3f}s: "
+        f"{steps / elapsed if elapsed else 0:.0f} steps/s",
+        file=sys.stderr,
+    )
+
+
+def main():
+    args = parse_replay_args()
+
+    # Логирование на каждом шаге только замедляло бы прогон. Предупреждения тоже отключаются:
+    # шаги без курса какой-либо валюты и так учитываются в числе пропущенных
+    logger.setLevel(logging.ERROR)
+
+    try:
+        asyncio.run(replay(args))
+    except ValueError as e:
+        sys.exit(f"Replay failed: {e}")
+
+
+if __name__ == "__main__":
+    main()
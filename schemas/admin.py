@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class AdmissionStatsSchema(BaseModel):
+    active: Dict[str, int] = Field(
+        ...,
+        examples=[{"read": 12, "write": 3}],
+        description="Число запросов в обработке по классам",
+    )
+    queued: Dict[str, int] = Field(
+        ...,
+        examples=[{"read": 40, "write": 0}],
+        description="Глубина очереди ожидания по классам",
+    )
+    admitted: Dict[str, int] = Field(
+        ...,
+        examples=[{"read": 10500, "write": 230}],
+        description="Число допущенных запросов по классам",
+    )
+    shed: Dict[str, int] = Field(
+        ...,
+        examples=[{"read": 17, "write": 0}],
+        description="Число отброшенных запросов по классам",
+    )
+
+
+class AdminResponse(BaseModel):
+    detail: str
+
+
+class StoreCallSchema(BaseModel):
+    name: str
+    duration: float
+
+
+class FetchStateSchema(BaseModel):
+    rates_updated_at: Optional[datetime] = None
+    fetch_task_running: bool
+
+
+class SlowRequestSchema(BaseModel):
+    method: str
+    path: str
+    route: Optional[str] = Field(None, description="Шаблон пути маршрута")
+    status: Optional[int] = None
+    duration: float = Field(..., description="Длительность запроса в секундах")
+    finished_at: datetime
+    store_calls: List[StoreCallSchema] = Field(
+        default_factory=list,
+        description="Вызовы BalanceStore и их длительность в секундах",
+    )
+    fetch_state: FetchStateSchema
+    stack: Optional[str] = Field(
+        None,
+        description="Стек потока цикла событий, снятый после превышения порога",
+    )
@@ -0,0 +1,39 @@
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+
+class AlertRuleCreateSchema(BaseModel):
+    kind: Literal["rate", "total"] = Field(
+        ...,
+        description="Тип правила: курс пары валют или общая сумма средств в валюте",
+    )
+    target: str = Field(
+        ...,
+        examples=["USD-RUB", "EUR"],
+        description="Пара валют для типа rate или код валюты для типа total",
+    )
+    direction: Literal["above", "below"] = Field(
+        ...,
+        description="Направление пересечения порога",
+    )
+    threshold: Decimal = Field(..., examples=[95.5], description="Порог")
+    webhook_url: AnyHttpUrl = Field(
+        ...,
+        examples=["http://localhost:9000/alerts"],
+        description="Адрес webhook для доставки оповещения",
+    )
+
+
+class AlertRuleSchema(BaseModel):
+    id: int
+    kind: str
+    target: str
+    direction: str
+    threshold: Decimal
+    webhook_url: str
+
+
+class AlertDeleteResponse(BaseModel):
+    detail: str
@@ -1,5 +1,7 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Type
 
 from pydantic import BaseModel, Field, create_model
 from typing_extensions import Optional
@@ -12,13 +14,31 @@ class AmountResponse(BaseModel):
     value: Decimal
 
 
-amount_set_fields = {
-    cur: (Optional[Decimal], Field(None, ge=0)) for cur in settings.currencies
-}
-AmountSetSchema = create_model("AmountSetSchema", **amount_set_fields)
+@lru_cache(maxsize=None)
+def amount_schema(name: str, non_negative: bool) -> Type[BaseModel]:
+    """
+    Создаёт схему с необязательным полем для каждой валюты из настроек.
 
-amount_update_fields = {cur: (Optional[Decimal], None) for cur in settings.currencies}
-AmountUpdateSchema = create_model("AmountUpdateSchema", **amount_update_fields)
+    Схема строится при первом обращении и кешируется, поэтому модули, которым она не нужна
+    (CLI, replay), не тратят время запуска на её создание.
+
+    :param name: Имя схемы.
+    :param non_negative: Запрещать ли отрицательные значения.
+    :return: Класс pydantic-модели.
+    """
+    fields = {
+        cur: (Optional[Decimal], Field(None, ge=0) if non_negative else None)
+        for cur in settings.currencies
+    }
+    return create_model(name, **fields)
+
+
+def __getattr__(name: str):
+    if name == "AmountSetSchema":
+        return amount_schema("AmountSetSchema", non_negative=True)
+    if name == "AmountUpdateSchema":
+        return amount_schema("AmountUpdateSchema", non_negative=False)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class AmountUpdateResponse(BaseModel):
@@ -41,3 +61,45 @@ class AmountTotalSchema(BaseModel):
         examples=[{"USD": 123.45, "EUR": 79.01}],
         description="Итоговая сумма по каждой валюте",
     )
+    unresolved: List[str] = Field(
+        default_factory=list,
+        examples=[["XYZ"]],
+        description="Валюты без курса: они не входят в курсы пар и итоговые суммы",
+    )
+    derived: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        examples=[{"AZN": ["AZN", "USD", "RUB"]}],
+        description="Курсы, выведенные через другие валюты: цепочка котировок до рубля",
+    )
+    rates_updated_at: Optional[datetime] = Field(
+        None,
+        description="Время получения текущих курсов",
+    )
+    rates_age: Optional[float] = Field(
+        None,
+        examples=[42.5],
+        description="Возраст текущих курсов в секундах",
+    )
+
+
+class ConvertItemSchema(BaseModel):
+    from_: str = Field(
+        ..., alias="from", examples=["USD"], description="Исходная валюта"
+    )
+    to: str = Field(..., examples=["RUB"], description="Целевая валюта")
+    amount: Decimal = Field(..., examples=[100], description="Сумма в исходной валюте")
+
+
+class ConvertRequestSchema(BaseModel):
+    items: List[ConvertItemSchema] = Field(
+        ...,
+        description="Список сумм для конвертации",
+    )
+
+
+class ConvertResponse(BaseModel):
+    values: List[Decimal] = Field(
+        ...,
+        examples=[[8000.0, 1.25]],
+        description="Сконвертированные суммы в порядке входного списка",
+    )
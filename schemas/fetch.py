@@ -1,7 +1,8 @@
+from datetime import date, datetime
 from decimal import Decimal
 
-from pydantic import BaseModel
-from typing import Dict
+from pydantic import AliasChoices, BaseModel, Field
+from typing import Dict, Optional
 
 
 class ValuteResponse(BaseModel):
@@ -11,4 +12,12 @@ class ValuteResponse(BaseModel):
 
 
 class ExchangeRateResponse(BaseModel):
+    Timestamp: Optional[datetime] = None
     Valute: Dict[str, ValuteResponse]
+
+
+class BaseRatesResponse(BaseModel):
+    base: str = Field(..., validation_alias=AliasChoices("base", "base_code"))
+    rates: Dict[str, Decimal]
+    date: Optional[date] = None
+    time_last_update_unix: Optional[int] = None
@@ -0,0 +1,31 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class LedgerEntrySchema(BaseModel):
+    seq: int = Field(..., description="Сквозной номер записи в журнале")
+    timestamp: datetime = Field(..., description="Время операции")
+    code: str = Field(..., examples=["USD"], description="Код валюты")
+    operation: str = Field(
+        ..., examples=["modify"], description="Тип операции: init, set или modify"
+    )
+    delta: Decimal = Field(..., examples=[-50], description="Изменение баланса")
+    balance: Decimal = Field(..., examples=[450], description="Баланс после операции")
+    request_id: Optional[str] = Field(
+        None, description="Идентификатор запроса, выполнившего операцию"
+    )
+
+
+class LedgerPageResponse(BaseModel):
+    entries: List[LedgerEntrySchema] = Field(
+        default_factory=list,
+        description="Записи журнала в порядке выполнения операций",
+    )
+    next_cursor: Optional[int] = Field(
+        None,
+        examples=[100],
+        description="Курсор следующей страницы; отсутствует, если записей больше нет",
+    )
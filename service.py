@@ -1,44 +1,79 @@
-import asyncio
+import importlib.util
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-import uvicorn
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
 
-from api import api_router
-from core import FetchService
 from core.config import settings
-from core.store import BalanceStore
-from utils.logger import setup_logging
+from utils.logger import build_perf_log_config, setup_logging
 from utils.cli import parse_args
-from utils.abstracts import AbstractFetchService
-from core.scheduler import scheduler_fetch, scheduler_print
-from core.middleware import register_middleware
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 logger = logging.getLogger(settings.logger.logger_name)
 
 
-def create_app(period: int, init_amount: Dict[str, Decimal]) -> FastAPI:
+def create_app(
+    period: int, init_amount: Dict[str, Decimal], perf: bool = False
+) -> "FastAPI":
     """ Функция для создания и конфигурирования FastAPI приложения.
 
     Инициализирует основные компоненты системы:
-    - Хранилище балансов (BalanceStore)
+    - Хранилище балансов (BalanceStore) с курсами из локального кеша, если он есть,
+      и журнал операций с балансами (Ledger)
     - Сервис получения данных (FetchService)
+    - Реестр правил оповещения и очередь их доставки
     - Фоновые задачи обновления и отображения данных
+    - Контроль допуска запросов к API
+    - Профилировщик и регистратор медленных запросов (выключены до вызова административного API)
     - API роутеры
 
     Args:
         period: Интервал обновления данных в секундах
         init_amount: Начальные балансы валют в формате {ВАЛЮТА: сумма}
+        perf: Профиль высокой производительности: ответы сериализуются orjson,
+            горячие маршруты на чтение не валидируют ответ повторно
 
     Returns:
         Сконфигурированный экземпляр FastAPI приложения
     """
-
-    store: BalanceStore = BalanceStore()
+    # FastAPI, httpx и модули приложения импортируются здесь, а не на уровне модуля,
+    # чтобы разбор аргументов CLI (в том числе --help и ошибки аргументов) не ждал их загрузки
+    import asyncio
+
+    from fastapi import FastAPI
+
+    from api import api_router
+    from core import FetchService
+    from core.admission import AdmissionController
+    from core.alerts import AlertEngine, WebhookDispatcher
+    from core.ledger import Ledger
+    from core.middleware import register_admission_middleware
+    from core.profiler import Profiler, SlowRequestRecorder
+    from core.rates_cache import load_rates_cache
+    from core.responses import DecimalORJSONResponse, orjson
+    from core.scheduler import scheduler_fetch, scheduler_print
+    from core.store import BalanceStore
+    from utils.abstracts import AbstractFetchService
+
+    ledger_config = settings.ledger_config
+    ledger = Ledger(
+        segment_size=ledger_config.segment_size,
+        max_memory_segments=ledger_config.max_memory_segments,
+        spill_dir=ledger_config.spill_dir,
+    )
+    store: BalanceStore = BalanceStore(ledger=ledger)
     store.init_amount(amounts=init_amount)
+    dispatcher = WebhookDispatcher()
+    alerts = AlertEngine(dispatcher=dispatcher)
+    store.add_listener(alerts.on_store_update)
+    cached_rates = load_rates_cache()
+    if cached_rates is not None:
+        rates, updated_at, derived = cached_rates
+        store.set_rates(rates=rates, updated_at=updated_at, derived=derived)
+        logger.info("Loaded cached rates from %s", updated_at.isoformat())
     fetch: AbstractFetchService = FetchService()
 
     @asynccontextmanager
@@ -46,26 +81,71 @@ def create_app(period: int, init_amount: Dict[str, Decimal]) -> FastAPI:
         # Запуск приложения
         logger.info("App started")
         app.state.store = store
+        app.state.ledger = ledger
         app.state.fetch = fetch
+        app.state.admission = admission
+        app.state.alerts = alerts
         app.state._fetch_task = asyncio.create_task(
             scheduler_fetch(store=store, fetch_service=fetch, period=period)
         )
         app.state._print_task = asyncio.create_task(scheduler_print(store=store))
+        app.state._alerts_task = asyncio.create_task(dispatcher.run())
 
         yield
         # Завершение приложения
         app.state._fetch_task.cancel()
         app.state._print_task.cancel()
+        app.state._alerts_task.cancel()
+        if app.state.slow_requests.enabled:
+            app.state.slow_requests.disable()
         await app.state._fetch_task
         await app.state._print_task
+        await app.state._alerts_task
         await app.state.fetch.aclose()
+        await dispatcher.aclose()
+        ledger.close()
         logger.info("App finished")
 
-    app = FastAPI(lifespan=lifespan)
+    admission_config = settings.admission_config
+    admission = AdmissionController(
+        max_active=admission_config.max_active,
+        read_limit=admission_config.read_limit,
+        write_limit=admission_config.write_limit,
+        max_queue=admission_config.max_queue,
+        queue_timeout=admission_config.queue_timeout,
+    )
+
+    if perf and orjson is None:
+        logger.warning("orjson is not installed, perf responses are disabled")
+        perf = False
+
+    if perf:
+        app = FastAPI(lifespan=lifespan, default_response_class=DecimalORJSONResponse)
+    else:
+        app = FastAPI(lifespan=lifespan)
+    app.state.perf = perf
+    app.state.profiler = Profiler()
+    app.state.slow_requests = SlowRequestRecorder(app=app, store=store)
     app.include_router(api_router)
+    if admission_config.enabled:
+        register_admission_middleware(app, admission)
     return app
 
 
+def perf_uvicorn_options() -> Dict[str, Any]:
+    """Параметры uvicorn для профиля высокой производительности.
+
+    Выбирает uvloop и httptools, если они установлены, и выборочный буферизованный access-лог.
+
+    Returns:
+        Именованные аргументы для uvicorn.run
+    """
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info("Perf profile: loop=%s, http=%s", loop, http)
+    return {"loop": loop, "http": http, "log_config": build_perf_log_config()}
+
+
 def main():
     args = parse_args()
 
@@ -76,14 +156,20 @@ def main():
         attr = getattr(args, currency)
         init_state[currency.upper()] = Decimal(attr)
 
-    app = create_app(period=args.period, init_amount=init_state)
+    app = create_app(period=args.period, init_amount=init_state, perf=args.perf)
     if args.debug:
+        from core.middleware import register_middleware
+
         register_middleware(app)
 
+    import uvicorn
+
+    run_options = perf_uvicorn_options() if args.perf else {}
     uvicorn.run(
         app=app,
         host=settings.run.host,
         port=settings.run.port,
+        **run_options,
         # workers=settings.run.count_workers,
         # reload=True if args.debug else False,
     )
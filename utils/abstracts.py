@@ -1,9 +1,14 @@
 from abc import abstractmethod, ABC
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from schemas.currency import AmountUpdateSchema
+if TYPE_CHECKING:
+    from schemas.currency import AmountUpdateSchema
 
 
 class AbstractFetchService(ABC):
+    # Цепочки котировок для курсов, выведенных через другие валюты при последнем получении
+    derived: Dict[str, List[str]] = {}
+
     @abstractmethod
     async def fetch_rates(self):
         pass
@@ -22,11 +27,15 @@ class AbstractCurrencyService(ABC):
         pass
 
     @abstractmethod
-    async def set_amount(self, set_amount: AmountUpdateSchema):
+    async def set_amount(
+        self, set_amount: "AmountUpdateSchema", request_id: Optional[str] = None
+    ):
         pass
 
     @abstractmethod
-    async def modify_amount(self, modify_amount: AmountUpdateSchema):
+    async def modify_amount(
+        self, modify_amount: "AmountUpdateSchema", request_id: Optional[str] = None
+    ):
         pass
 
     @abstractmethod
@@ -34,3 +43,7 @@ class AbstractCurrencyService(ABC):
         self,
     ):
         pass
+
+    @abstractmethod
+    async def convert(self, items):
+        pass
@@ -0,0 +1,542 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from core.config import BASE_DIR, settings
+
+BENCH_RATES = {"USD": "80.5", "EUR": "90.25", "RUB": "1", "AZN": "47.35"}
+
+
+def start_service(
+    port: int,
+    perf: bool,
+    workdir: Path,
+    extra_env: Optional[Dict[str, str]] = None,
+) -> subprocess.Popen:
+    """
+    Запускает сервис в отдельном процессе с тёплым кешем курсов, чтобы он не зависел от внешнего API.
+
+    Args:
+        port (int): Порт сервиса.
+        perf (bool): Запускать ли сервис в профиле --perf.
+        workdir (Path): Каталог для кеша курсов и логов процесса.
+        extra_env (Optional[Dict[str, str]]): Дополнительные переменные окружения процесса.
+
+    Returns:
+        subprocess.Popen: Запущенный процесс сервиса.
+    """
+    rates_file = workdir / "rates_cache.json"
+    rates_file.write_text(
+        json.dumps(
+            {
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "rates": BENCH_RATES,
+                "derived": {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    env = {
+        **os.environ,
+        "RUN": json.dumps({"host": "127.0.0.1", "port": port}),
+        "CACHE_CONFIG": json.dumps({"rates_file": str(rates_file)}),
+        "LOGGER": json.dumps({"log_file": str(workdir / "app.log")}),
+        **(extra_env or {}),
+    }
+    args = [sys.executable, "-m", "service", "--period", "60"]
+    for currency in settings.currencies:
+        args += [f"--{currency}", "1000"]
+    if perf:
+        args.append("--perf")
+    return subprocess.Popen(
+        args,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(url: str, timeout: float, interval: float = 0.01) -> float:
+    """
+    Ожидает первого успешного ответа сервиса.
+
+    Args:
+        url (str): Адрес, опрашиваемый до первого ответа 200.
+        timeout (float): Максимальное время ожидания в секундах.
+        interval (float): Пауза между попытками в секундах.
+
+    Returns:
+        float: Время до первого ответа 200 в секундах.
+
+    Raises:
+        TimeoutError: Если сервис не ответил за отведённое время.
+    """
+    started = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() - started < timeout:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(interval)
+    raise TimeoutError(f"Service is not ready after {timeout}s: {url}")
+
+
+async def _get(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: bytes
+) -> int:
+    """
+    Отправляет GET-запрос по открытому keep-alive соединению и читает ответ целиком.
+
+    Args:
+        reader (asyncio.StreamReader): Поток чтения соединения.
+        writer (asyncio.StreamWriter): Поток записи соединения.
+        request (bytes): Готовый HTTP/1.1 запрос.
+
+    Returns:
+        int: HTTP-статус ответа.
+    """
+    writer.write(request)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *headers = head.decode("latin-1").split("\r\n")
+    length = 0
+    for header in headers:
+        name, _, value = header.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split(" ", 2)[1])
+
+
+async def run_load(
+    host: str, port: int, path: str, requests: int, concurrency: int
+) -> Dict[str, float]:
+    """
+    Нагружает адрес запросами с заданной конкурентностью.
+
+    Клиент работает поверх asyncio-потоков с keep-alive соединениями, чтобы его собственные
+    накладные расходы не скрывали разницу между профилями сервиса.
+
+    Args:
+        host (str): Хост сервиса.
+        port (int): Порт сервиса.
+        path (str): Путь для нагрузки.
+        requests (int): Общее число запросов.
+        concurrency (int): Число одновременных соединений.
+
+    Returns:
+        Dict[str, float]: Пропускная способность (rps), p50 и p99 задержки в миллисекундах, число ошибок.
+    """
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in remaining:
+                started = time.perf_counter()
+                status = await _get(reader, writer, request)
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "errors": errors,
+    }
+
+
+async def bench_http(args: argparse.Namespace) -> None:
+    """
+    Сравнивает пропускную способность и задержки сервиса в обычном профиле и в профиле --perf.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы командной строки.
+    """
+    host = "127.0.0.1"
+    url = f"http://{host}:{args.port}{args.path}"
+    profiles = {"default": False, "perf": True}
+    for name, perf in profiles.items():
+        with tempfile.TemporaryDirectory() as workdir:
+            process = start_service(args.port, perf, Path(workdir))
+            try:
+                await wait_ready(url, timeout=30)
+                await run_load(host, args.port, args.path, 500, concurrency=8)
+                result = await run_load(
+                    host, args.port, args.path, args.requests, args.concurrency
+                )
+            finally:
+                process.terminate()
+                process.wait()
+        print(
+            f"{name:>8}: {result['rps']:8.0f} rps, p50 {result['p50_ms']:6.2f} ms, "
+            f"p99 {result['p99_ms']:6.2f} ms, errors {result['errors']}"
+        )
+
+
+def _timed_run(args: List[str]) -> float:
+    """
+    Запускает команду Python и замеряет время до её завершения.
+
+    Args:
+        args (List[str]): Аргументы интерпретатора.
+
+    Returns:
+        float: Время выполнения в секундах.
+    """
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=BASE_DIR,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started
+
+
+async def bench_startup(args: argparse.Namespace) -> None:
+    """
+    Измеряет время холодного старта: импорт модуля сервиса, вывод справки CLI
+    и время от запуска процесса до первого ответа 200 на горячем маршруте.
+
+    Для каждой метрики выводится медиана по нескольким запускам.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы командной строки.
+    """
+    host = "127.0.0.1"
+    url = f"http://{host}:{args.port}{args.path}"
+    results: Dict[str, List[float]] = {"import": [], "cli --help": [], "ready": []}
+    for _ in range(args.runs):
+        results["import"].append(_timed_run(["-c", "import service"]))
+        results["cli --help"].append(_timed_run(["-m", "service", "--help"]))
+        with tempfile.TemporaryDirectory() as workdir:
+            started = time.perf_counter()
+            process = start_service(args.port, args.perf, Path(workdir))
+            try:
+                await wait_ready(url, timeout=30, interval=0.002)
+                results["ready"].append(time.perf_counter() - started)
+            finally:
+                process.terminate()
+                process.wait()
+
+    for name, values in results.items():
+        print(
+            f"{name:>10}: median {statistics.median(values) * 1000:7.1f} ms, "
+            f"min {min(values) * 1000:7.1f} ms"
+        )
+
+
+def _is_consistent(summary: Dict[str, Any], anchor: str) -> bool:
+    """
+    Проверяет, что сводка рассчитана по одной версии количеств и одной версии курсов.
+
+    Нагрузка записывает одинаковые количества всех валют и одинаковые курсы всех валют
+    к опорной, поэтому в согласованной сводке общая сумма в опорной валюте равна
+    amount * (rate * (n - 1) + 1).
+
+    Args:
+        summary (Dict[str, Any]): Сводка BalanceStore.
+        anchor (str): Опорная валюта с курсом 1.
+
+    Returns:
+        bool: True, если сводка согласована.
+    """
+    amounts = set(summary["amounts"].values())
+    codes = [code for code in summary["amounts"] if code != anchor]
+    rates = {summary["rates"][f"{code}-{anchor}"] for code in codes}
+    if len(amounts) != 1 or len(rates) != 1:
+        return False
+    amount, rate = amounts.pop(), rates.pop()
+    expected = round(amount * (rate * len(codes) + 1), 4)
+    return summary["total"][anchor] == expected
+
+
+async def bench_stress(args: argparse.Namespace) -> None:
+    """
+    Проверяет под конкурентной нагрузкой, что BalanceStore не возвращает сводку,
+    собранную из разных версий данных.
+
+    Потоки-писатели попеременно обновляют количества и курсы, потоки-читатели запрашивают
+    сводку и проверяют её согласованность. Интервал переключения потоков уменьшается,
+    чтобы переключения происходили внутри операций хранилища.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы командной строки.
+    """
+    from core.store import BalanceStore
+
+    anchor = "RUB"
+    codes = [currency.upper() for currency in settings.currencies]
+    store = BalanceStore()
+    store.init_amount({code: Decimal(1) for code in codes})
+    store.set_rates({code: Decimal(1) for code in codes})
+
+    stop = threading.Event()
+    counters = {"writes": 0, "reads": 0, "mixed": 0}
+    lock = threading.Lock()
+
+    def writer(offset: int) -> None:
+        step = offset
+        while not stop.is_set():
+            step += 1
+            store.set_amount({code: Decimal(step) for code in codes})
+            rate = Decimal(step % 97 + 2)
+            store.set_rates(
+                {code: Decimal(1) if code == anchor else rate for code in codes}
+            )
+            with lock:
+                counters["writes"] += 2
+
+    def reader() -> None:
+        reads = mixed = 0
+        while not stop.is_set():
+            reads += 1
+            if not _is_consistent(store.summary(), anchor):
+                mixed += 1
+        with lock:
+            counters["reads"] += reads
+            counters["mixed"] += mixed
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [
+        threading.Thread(target=writer, args=(i * 1_000_000,))
+        for i in range(args.writers)
+    ] + [threading.Thread(target=reader) for _ in range(args.readers)]
+    try:
+        for thread in threads:
+            thread.start()
+        await asyncio.sleep(args.seconds)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(switch_interval)
+
+    print(
+        f"writes {counters['writes']}, summaries {counters['reads']}, "
+        f"mixed-version summaries {counters['mixed']}"
+    )
+    if counters["mixed"]:
+        sys.exit(1)
+
+
+class StubReceiver:
+    """
+    Локальный приёмник webhook для проверки доставки оповещений.
+
+    Первые fail_first попыток доставки каждого правила получают ответ 503, следующие — 200,
+    поэтому по счётчикам видно и доставку, и повторные попытки.
+    """
+
+    def __init__(self, fail_first: int) -> None:
+        """
+        Инициализирует приёмник.
+
+        Args:
+            fail_first (int): Сколько первых попыток доставки каждого правила отклонять.
+        """
+        self.fail_first = fail_first
+        self.attempts: Dict[int, int] = {}
+        self.delivered: Dict[int, float] = {}
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Обрабатывает POST-запросы одного keep-alive соединения.
+
+        Args:
+            reader (asyncio.StreamReader): Поток чтения соединения.
+            writer (asyncio.StreamWriter): Поток записи соединения.
+        """
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for header in head.decode("latin-1").split("\r\n")[1:]:
+                    name, _, value = header.partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                rule_id = json.loads(await reader.readexactly(length))["rule_id"]
+                attempt = self.attempts.get(rule_id, 0) + 1
+                self.attempts[rule_id] = attempt
+                if attempt > self.fail_first:
+                    self.delivered.setdefault(rule_id, time.perf_counter())
+                    status = b"200 OK"
+                else:
+                    status = b"503 Service Unavailable"
+                writer.write(b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def bench_alerts(args: argparse.Namespace) -> None:
+    """
+    Проверяет доставку оповещений на локальный приёмник-заглушку.
+
+    Сервис запускается с административным токеном и короткой задержкой повторов, регистрирует
+    правила, срабатывающие сразу (общая сумма выше нуля), а приёмник отклоняет первые попытки
+    доставки каждого правила. Бенчмарк выводит время регистрации, число доставок и повторов
+    и завершается с кодом 1, если какое-либо оповещение не доставлено.
+
+    Args:
+        args (argparse.Namespace): Разобранные аргументы командной строки.
+    """
+    host = "127.0.0.1"
+    token = "bench"
+    receiver = StubReceiver(fail_first=args.fail_first)
+    server = await asyncio.start_server(receiver.handle, host, args.receiver_port)
+    extra_env = {
+        "ADMIN_CONFIG": json.dumps({"token": token}),
+        "ALERTS_CONFIG": json.dumps(
+            {"retry_backoff": 0.05, "max_retries": args.fail_first + 2}
+        ),
+    }
+    base_url = f"http://{host}:{args.port}"
+    webhook_url = f"http://{host}:{args.receiver_port}/alerts"
+    code = settings.currencies[0]
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            process = start_service(args.port, False, Path(workdir), extra_env)
+            try:
+                await wait_ready(f"{base_url}/api/v1/amount/get/", timeout=30)
+                remaining = iter(range(args.rules))
+                failures = 0
+
+                async def register(client: httpx.AsyncClient) -> None:
+                    nonlocal failures
+                    for _ in remaining:
+                        response = await client.post(
+                            "/api/v1/alerts/",
+                            headers={"X-Admin-Token": token},
+                            json={
+                                "kind": "total",
+                                "target": code,
+                                "direction": "above",
+                                "threshold": 0,
+                                "webhook_url": webhook_url,
+                            },
+                        )
+                        if response.status_code != 200:
+                            failures += 1
+
+                started = time.perf_counter()
+                async with httpx.AsyncClient(base_url=base_url) as client:
+                    await asyncio.gather(
+                        *(register(client) for _ in range(args.concurrency))
+                    )
+                registered = time.perf_counter() - started
+
+                deadline = time.perf_counter() + args.timeout
+                while (
+                    len(receiver.delivered) < args.rules - failures
+                    and time.perf_counter() < deadline
+                ):
+                    await asyncio.sleep(0.05)
+            finally:
+                process.terminate()
+                process.wait()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    delivered = len(receiver.delivered)
+    retries = sum(receiver.attempts.values()) - len(receiver.attempts)
+    last = max(receiver.delivered.values(), default=started)
+    print(
+        f"registered {args.rules - failures}/{args.rules} rules in {registered:.2f}s, "
+        f"delivered {delivered} alerts ({retries} retries) "
+        f"in {last - started:.2f}s"
+    )
+    if failures or delivered < args.rules:
+        sys.exit(1)
+
+
+def parse_bench_args() -> argparse.Namespace:
+    """
+    Парсит аргументы командной строки бенчмарка.
+    """
+    parser = argparse.ArgumentParser(description="Currency Service benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    http_parser = subparsers.add_parser(
+        "http", help="Compare default and --perf profiles under HTTP load"
+    )
+    http_parser.add_argument("--port", type=int, default=8765)
+    http_parser.add_argument("--path", default="/api/v1/amount/get/")
+    http_parser.add_argument("--requests", type=int, default=20000)
+    http_parser.add_argument("--concurrency", type=int, default=32)
+    http_parser.set_defaults(handler=bench_http)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure import time and time to the first 200 response"
+    )
+    startup_parser.add_argument("--port", type=int, default=8765)
+    startup_parser.add_argument("--path", default="/api/v1/amount/get/")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.add_argument("--perf", action="store_true")
+    startup_parser.set_defaults(handler=bench_startup)
+
+    stress_parser = subparsers.add_parser(
+        "stress", help="Check that concurrent readers never see mixed store versions"
+    )
+    stress_parser.add_argument("--seconds", type=float, default=5)
+    stress_parser.add_argument("--writers", type=int, default=2)
+    stress_parser.add_argument("--readers", type=int, default=4)
+    stress_parser.set_defaults(handler=bench_stress)
+
+    alerts_parser = subparsers.add_parser(
+        "alerts", help="Register alert rules and check webhook delivery and retries"
+    )
+    alerts_parser.add_argument("--port", type=int, default=8765)
+    alerts_parser.add_argument("--receiver-port", type=int, default=8766)
+    alerts_parser.add_argument("--rules", type=int, default=1000)
+    alerts_parser.add_argument("--concurrency", type=int, default=16)
+    alerts_parser.add_argument("--fail-first", type=int, default=1)
+    alerts_parser.add_argument("--timeout", type=float, default=30)
+    alerts_parser.set_defaults(handler=bench_alerts)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_bench_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import argparse
 from decimal import Decimal
+from pathlib import Path
 
 from core.config import settings
 
@@ -76,7 +77,28 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Debug mode",
     )
+    parser.add_argument(
+        "--perf",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="High-performance runtime profile",
+    )
+
+    add_currency_args(parser)
+
+    args = parser.parse_args()
+    return args
+
 
+def add_currency_args(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет в парсер аргументы начальных сумм для каждой валюты из конфигурации.
+
+    Args:
+        parser (argparse.ArgumentParser): Парсер аргументов командной строки.
+    """
     for currency in settings.currencies:
         parser.add_argument(
             f"--{currency}",
@@ -85,5 +107,30 @@ def parse_args() -> argparse.Namespace:
             help=f"Initial {currency} amount",
         )
 
+
+def parse_replay_args() -> argparse.Namespace:
+    """
+    Парсит аргументы командной строки для воспроизведения истории курсов.
+
+    Функция создает парсер с обязательным путём к записанной истории курсов (каталог снимков
+    daily_json.js или CSV-файл), опциональным файлом для результатов и аргументами для начальных
+    сумм валют, указанных в конфигурации. Возвращает разобранные аргументы.
+    """
+    parser = argparse.ArgumentParser(description="Currency Service replay")
+    parser.add_argument(
+        "--source",
+        type=Path,
+        required=True,
+        help="Directory of daily_json.js snapshots or a CSV file with rates",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="CSV file for per-step totals (stdout by default)",
+    )
+
+    add_currency_args(parser)
+
     args = parser.parse_args()
     return args
@@ -1,4 +1,7 @@
+import copy
+import itertools
 import logging
+from typing import Any, Dict
 
 from core.config import settings
 
@@ -15,7 +18,7 @@ def setup_logging(debug: bool):
     Эта функция настраивает логгер с именем, указанным в конфигурации настроек.
     Логгер настроен для вывода логов как в консоль, так и в файл, с уровнем логирования,
     определяемым параметром `debug`. Формат логов включает временную метку, имя логгера,
-    уровень логирования и сообщение.
+    уровень логирования и сообщение. Файл журнала открывается при первой записи.
 
     Args:
         debug (bool): Если True, устанавливает уровень логирования на DEBUG; в противном случае — на INFO.
@@ -30,6 +33,7 @@ def setup_logging(debug: bool):
     file_handler = logging.FileHandler(
         settings.logger.log_file,
         encoding="utf-8",
+        delay=True,
     )
 
     console_handler.setFormatter(formatter)
@@ -37,3 +41,57 @@ def setup_logging(debug: bool):
 
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
+
+
+class SampleFilter(logging.Filter):
+    """
+    Фильтр, пропускающий каждую N-ю запись уровня ниже WARNING и все записи уровня WARNING и выше.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Инициализирует экземпляр класса SampleFilter.
+
+        Args:
+            rate (float): Доля пропускаемых записей (например, 0.01 — каждая сотая).
+        """
+        super().__init__()
+        self._every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        return bool(self._every) and next(self._counter) % self._every == 0
+
+
+def build_perf_log_config() -> Dict[str, Any]:
+    """
+    Формирует конфигурацию логирования uvicorn для профиля --perf.
+
+    Access-лог выборочный (доля записей задаётся `access_log_sample_rate`) и буферизованный:
+    записи копятся в MemoryHandler и сбрасываются в поток пачками по `access_log_buffer` записей
+    или сразу при записи уровня ERROR.
+
+    Returns:
+        Dict[str, Any]: Конфигурация для logging.config.dictConfig.
+    """
+    from uvicorn.config import LOGGING_CONFIG
+
+    perf_config = settings.perf_config
+    config = copy.deepcopy(LOGGING_CONFIG)
+    config["filters"] = {
+        "access_sample": {
+            "()": SampleFilter,
+            "rate": perf_config.access_log_sample_rate,
+        },
+    }
+    config["handlers"]["access_stream"] = config["handlers"].pop("access")
+    config["handlers"]["access"] = {
+        "class": "logging.handlers.MemoryHandler",
+        "capacity": perf_config.access_log_buffer,
+        "flushLevel": logging.ERROR,
+        "target": "access_stream",
+    }
+    config["loggers"]["uvicorn.access"]["filters"] = ["access_sample"]
+    return config